@@ -1,6 +1,5 @@
 import os
 import json
-import networkx as nx
 
 # Create the project directory structure
 project_structure = {
@@ -21,21 +20,33 @@ project_structure = {
 }
 
 def create_directory_structure(base_path, structure):
-    """Create directory structure recursively"""
-    for name, content in structure.items():
-        path = os.path.join(base_path, name)
-        if isinstance(content, dict) and content:
-            # It's a directory with content
-            os.makedirs(path, exist_ok=True)
-            create_directory_structure(path, content)
-        elif isinstance(content, dict) and not content:
-            # It's an empty file
-            if not name.endswith('/'):
-                with open(path, 'w') as f:
-                    f.write('')
-        else:
-            # It's a directory
-            os.makedirs(path, exist_ok=True)
+    """Create directory structure: collect all paths first, then create each once"""
+    dirs, files = set(), []
+    stack = [(base_path, structure)]
+    while stack:
+        parent, entries = stack.pop()
+        for name, content in entries.items():
+            # Every segment is a literal from project_structure, so skip os.path.join normalization
+            path = parent + os.sep + name
+            if isinstance(content, dict) and content:
+                # It's a directory with content
+                dirs.add(path)
+                stack.append((path, content))
+            elif isinstance(content, dict) and not content:
+                # It's an empty file
+                if not name.endswith('/'):
+                    files.append(path)
+            else:
+                # It's a directory
+                dirs.add(path)
+    
+    for path in sorted(dirs):
+        os.makedirs(path, exist_ok=True)
+    
+    # Empty files only need to exist, so skip the buffered file object
+    for path in files:
+        fd = os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644)
+        os.close(fd)
 
 # Create the project structure
 create_directory_structure('.', project_structure)
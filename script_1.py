@@ -1,11 +1,13 @@
 # Create requirements.txt
-requirements_content = """# CivicMindAI Requirements
+import os
+
+requirements_content = b"""# CivicMindAI Requirements
 streamlit>=1.28.0
 langchain>=0.0.340
 langchain-openai>=0.0.2
 faiss-cpu>=1.7.4
 chromadb>=0.4.15
-networkx>=3.2.1
+pyahocorasick>=2.0.0
 openai>=1.3.0
 sentence-transformers>=2.2.2
 pandas>=2.1.0
@@ -17,11 +19,25 @@ requests>=2.31.0
 beautifulsoup4>=4.12.0
 """
 
-with open('CivicMindAI/requirements.txt', 'w') as f:
+# Accelerators with pure-Python fallbacks, kept out of requirements.txt so a failed build cannot break the install
+optional_requirements_content = b"""# CivicMindAI Optional Requirements
+# pip install -r requirements-optional.txt
+# Routing regexes in one scan; needs libhs to build, falls back to re
+hyperscan>=0.4.0
+# Faster civic_cache.json loading; falls back to json
+orjson>=3.9.0
+"""
+
+with open(os.sep.join(('CivicMindAI', 'requirements.txt')), 'wb') as f:
     f.write(requirements_content)
 
+with open(os.sep.join(('CivicMindAI', 'requirements-optional.txt')), 'wb') as f:
+    f.write(optional_requirements_content)
+
 print("✅ Requirements.txt created successfully!")
-print("\nDependencies included:")
-for line in requirements_content.strip().split('\n'):
-    if line and not line.startswith('#'):
-        print(f"  • {line}")
\ No newline at end of file
+for title, content in (("Dependencies included", requirements_content),
+                       ("Optional dependencies", optional_requirements_content)):
+    print(f"\n{title}:")
+    for line in content.decode().strip().split('\n'):
+        if line and not line.startswith('#'):
+            print(f"  • {line}")
\ No newline at end of file
@@ -1,12 +1,18 @@
 # Create the SLM (Small Language Model) module
+import os
+from pathlib import Path
+
 slm_module_code = '''"""
 SLM (Small Language Model Interface) Module for CivicMindAI
 Handles general chit-chat and fallback responses using OpenAI API or local models.
 """
 
 import os
-from typing import Dict, Any, Optional
+import re
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 import logging
+import time
 from datetime import datetime
 try:
     import openai
@@ -14,6 +20,48 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+# Configure logging once per process and share one logger per module
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Predefined fallback responses for when API is not available (shared, read-only)
+FALLBACK_RESPONSES: Mapping[str, str] = MappingProxyType({
+    'greeting': "Hello! I'm CivicMindAI, your Chennai civic assistant. I can help you with civic services, government procedures, emergency contacts, and more. What can I assist you with today?",
+    
+    'who_are_you': "I'm CivicMindAI, an AI-powered civic assistant specifically designed to help Chennai residents with civic issues. I use advanced AI technologies like RAG, KAG, and CAG to provide accurate and up-to-date information about municipal services, government procedures, and civic amenities.",
+    
+    'capabilities': "I can help you with:\\n• Emergency contact numbers\\n• Civic service procedures (water, tax, certificates)\\n• Government office information\\n• Municipal service complaints\\n• Zone-specific contacts\\n• Latest civic updates and guidelines",
+    
+    'thanks': "You're welcome! I'm here to help Chennai residents with civic issues anytime. Feel free to ask if you have more questions about municipal services, government procedures, or civic amenities.",
+    
+    'goodbye': "Goodbye! Thank you for using CivicMindAI. Remember, I'm always here to help with your Chennai civic needs. Have a great day!",
+    
+    'help': "I'm your Chennai civic assistant! You can ask me about:\\n• Emergency numbers (fire, police, ambulance)\\n• Water supply issues and CMWSSB services\\n• Property tax payment procedures\\n• Garbage collection schedules\\n• Birth/death certificate applications\\n• Municipal office contacts\\n• And much more civic information!",
+    
+    'how_it_works': "I use four advanced AI technologies:\\n🔍 **RAG**: Searches official documents and web sources\\n🧠 **KAG**: Uses knowledge graphs for step-by-step procedures\\n⚡ **CAG**: Provides instant answers from cached information\\n🤖 **SLM**: Handles general conversation (that's me!)\\n\\nI automatically choose the best method based on your question type.",
+    
+    'about_chennai': "Chennai, the capital of Tamil Nadu, is served by several civic bodies:\\n• Greater Chennai Corporation (GCC) - Municipal services\\n• CMWSSB - Water supply and sewerage\\n• TANGEDCO - Electricity\\n• Tamil Nadu Police - Law and order\\n\\nI can help you interact with all these services efficiently!",
+    
+    'feedback': "I appreciate your feedback! While I can't store it permanently, your input helps me understand how to better assist Chennai residents. If you have specific suggestions about civic services, I recommend contacting the relevant departments directly using the contact numbers I can provide.",
+    
+    'default': "I understand you're asking about something civic-related, but I need more specific information to help you properly. Could you please ask about:\\n• A specific civic service (water, tax, certificates)\\n• An emergency contact number\\n• A government procedure\\n• A municipal office contact\\n\\nWhat exactly can I help you with today?"
+})
+
+# Query type classifier: one named group per category, in priority order.
+# Greetings, thanks and goodbyes match on word boundaries ('bye' is not in 'maybe').
+QUERY_TYPE_PATTERN = re.compile(
+    r'(?P<greeting>\\b(?:hello|hi|hey|good morning|good afternoon|good evening)\\b)'
+    r'|(?P<who_are_you>who are you|what are you|tell me about yourself|introduce yourself)'
+    r'|(?P<capabilities>what can you do|your capabilities|what do you help with|services)'
+    r'|(?P<thanks>\\b(?:thank|appreciate))'
+    r'|(?P<goodbye>\\b(?:goodbye|bye|see you|exit|quit)\\b)'
+    r'|(?P<help>help|assist|support|guide)'
+    r'|(?P<how_it_works>how do you work|how does this work|explain your system)'
+    r'|(?P<about_chennai>tell me about chennai|about chennai|chennai city)'
+    r'|(?P<feedback>feedback|suggestion|improve|better)'
+)
+
 class SLMModule:
     """
     Small Language Model interface that handles general conversation,
@@ -28,6 +76,7 @@ class SLMModule:
             api_key (str, optional): OpenAI API key (can be set via env variable)
             model (str): Model name to use (default: gpt-3.5-turbo)
         """
+        self.logger = logger
         self.model = model
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
         
@@ -46,86 +95,33 @@ class SLMModule:
             else:
                 print("Warning: No OpenAI API key provided. Using fallback responses.")
         
-        # Setup logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
-        
         # Fallback responses for when API is not available
-        self.fallback_responses = self._initialize_fallback_responses()
+        self.fallback_responses = FALLBACK_RESPONSES
     
-    def _initialize_fallback_responses(self) -> Dict[str, str]:
-        """Initialize predefined fallback responses for common queries."""
-        return {
-            'greeting': "Hello! I'm CivicMindAI, your Chennai civic assistant. I can help you with civic services, government procedures, emergency contacts, and more. What can I assist you with today?",
-            
-            'who_are_you': "I'm CivicMindAI, an AI-powered civic assistant specifically designed to help Chennai residents with civic issues. I use advanced AI technologies like RAG, KAG, and CAG to provide accurate and up-to-date information about municipal services, government procedures, and civic amenities.",
-            
-            'capabilities': "I can help you with:\\n• Emergency contact numbers\\n• Civic service procedures (water, tax, certificates)\\n• Government office information\\n• Municipal service complaints\\n• Zone-specific contacts\\n• Latest civic updates and guidelines",
-            
-            'thanks': "You're welcome! I'm here to help Chennai residents with civic issues anytime. Feel free to ask if you have more questions about municipal services, government procedures, or civic amenities.",
-            
-            'goodbye': "Goodbye! Thank you for using CivicMindAI. Remember, I'm always here to help with your Chennai civic needs. Have a great day!",
-            
-            'help': "I'm your Chennai civic assistant! You can ask me about:\\n• Emergency numbers (fire, police, ambulance)\\n• Water supply issues and CMWSSB services\\n• Property tax payment procedures\\n• Garbage collection schedules\\n• Birth/death certificate applications\\n• Municipal office contacts\\n• And much more civic information!",
-            
-            'how_it_works': "I use four advanced AI technologies:\\n🔍 **RAG**: Searches official documents and web sources\\n🧠 **KAG**: Uses knowledge graphs for step-by-step procedures\\n⚡ **CAG**: Provides instant answers from cached information\\n🤖 **SLM**: Handles general conversation (that's me!)\\n\\nI automatically choose the best method based on your question type.",
-            
-            'about_chennai': "Chennai, the capital of Tamil Nadu, is served by several civic bodies:\\n• Greater Chennai Corporation (GCC) - Municipal services\\n• CMWSSB - Water supply and sewerage\\n• TANGEDCO - Electricity\\n• Tamil Nadu Police - Law and order\\n\\nI can help you interact with all these services efficiently!",
-            
-            'feedback': "I appreciate your feedback! While I can't store it permanently, your input helps me understand how to better assist Chennai residents. If you have specific suggestions about civic services, I recommend contacting the relevant departments directly using the contact numbers I can provide.",
-            
-            'default': "I understand you're asking about something civic-related, but I need more specific information to help you properly. Could you please ask about:\\n• A specific civic service (water, tax, certificates)\\n• An emergency contact number\\n• A government procedure\\n• A municipal office contact\\n\\nWhat exactly can I help you with today?"
-        }
-    
-    def classify_query_type(self, query: str) -> str:
+    def classify_query_type(self, query: str, query_lower: Optional[str] = None) -> str:
         """
         Classify the type of query to provide appropriate fallback response.
         
         Args:
             query (str): User query
+            query_lower (str, optional): Precomputed lowercase form of the query
             
         Returns:
             str: Query type classification
         """
-        query_lower = query.lower()
-        
-        # Greeting patterns
-        if any(word in query_lower for word in ['hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening']):
-            return 'greeting'
-        
-        # Identity questions
-        if any(phrase in query_lower for phrase in ['who are you', 'what are you', 'tell me about yourself', 'introduce yourself']):
-            return 'who_are_you'
+        if query_lower is None:
+            query_lower = query.lower()
         
-        # Capability questions
-        if any(phrase in query_lower for phrase in ['what can you do', 'your capabilities', 'what do you help with', 'services']):
-            return 'capabilities'
-        
-        # Thank you messages
-        if any(word in query_lower for word in ['thank', 'thanks', 'appreciate']):
-            return 'thanks'
-        
-        # Goodbye messages
-        if any(word in query_lower for word in ['bye', 'goodbye', 'see you', 'exit', 'quit']):
-            return 'goodbye'
-        
-        # Help requests
-        if any(word in query_lower for word in ['help', 'assist', 'support', 'guide']):
-            return 'help'
-        
-        # How it works
-        if any(phrase in query_lower for phrase in ['how do you work', 'how does this work', 'explain your system']):
-            return 'how_it_works'
-        
-        # About Chennai
-        if any(phrase in query_lower for phrase in ['about chennai', 'chennai city', 'tell me about chennai']):
-            return 'about_chennai'
-        
-        # Feedback
-        if any(word in query_lower for word in ['feedback', 'suggestion', 'improve', 'better']):
-            return 'feedback'
-        
-        return 'default'
+        # One regex scan; the highest-priority category among all matches wins
+        matched_types = {match.lastgroup for match in QUERY_TYPE_PATTERN.finditer(query_lower)}
+        if not matched_types:
+            return 'default'
+        return min(matched_types, key=QUERY_TYPE_PATTERN.groupindex.get)
+    
+    @staticmethod
+    def _format_ts(timestamp_ns: int) -> str:
+        """Format a time.time_ns() timestamp as HH:MM:SS for display."""
+        return datetime.fromtimestamp(timestamp_ns / 1e9).strftime('%H:%M:%S')
     
     def generate_openai_response(self, query: str) -> Optional[str]:
         """
@@ -164,12 +160,13 @@ class SLMModule:
             self.logger.error(f"OpenAI API error: {str(e)}")
             return None
     
-    def get_response(self, query: str) -> Dict[str, Any]:
+    def get_response(self, query: str, query_lower: Optional[str] = None) -> Dict[str, Any]:
         """
         Get SLM response for general queries and chitchat.
         
         Args:
             query (str): User query
+            query_lower (str, optional): Precomputed lowercase form of the query
             
         Returns:
             Dict containing response data
@@ -188,12 +185,12 @@ class SLMModule:
                         },
                         'source': 'SLM',
                         'query': query,
-                        'timestamp': datetime.now().isoformat(),
+                        'timestamp': time.time_ns(),
                         'message': f'Response generated using {self.model}'
                     }
             
             # Fallback to predefined responses
-            query_type = self.classify_query_type(query)
+            query_type = self.classify_query_type(query, query_lower=query_lower)
             fallback_response = self.fallback_responses.get(query_type, self.fallback_responses['default'])
             
             return {
@@ -205,7 +202,7 @@ class SLMModule:
                 },
                 'source': 'SLM',
                 'query': query,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': time.time_ns(),
                 'message': f'Fallback response for query type: {query_type}'
             }
             
@@ -236,7 +233,7 @@ class SLMModule:
         
         # Add method indicator
         if data['method'] == 'OpenAI API':
-            footer = f"\\n\\n💬 *Response generated via {data['model']} at {datetime.now().strftime('%H:%M:%S')}*"
+            footer = f"\\n\\n💬 *Response generated via {data['model']} at {self._format_ts(response_data['timestamp'])}*"
         else:
             footer = f"\\n\\n🤖 *Predefined response for {data['query_type']} query*"
         
@@ -267,8 +264,7 @@ if __name__ == "__main__":
         print("-" * 50)
 '''
 
-with open('CivicMindAI/slm_module.py', 'w') as f:
-    f.write(slm_module_code)
+Path(os.sep.join(('CivicMindAI', 'slm_module.py'))).write_text(slm_module_code, encoding='utf-8', newline='\n')
 
 print("✅ SLM (Small Language Model Interface) module created!")
 print("Features implemented:")
@@ -1,13 +1,34 @@
 # Create the Agent Controller module
+import os
+from pathlib import Path
+
 agent_controller_code = '''"""
 Agent Controller for CivicMindAI
 Intelligent routing agent that decides which AI module (RAG/KAG/CAG/SLM) to use based on query analysis.
 """
 
 import re
-from typing import Dict, Any, List, Optional
+import functools
+import threading
+from typing import Dict, Any, Callable, List, Optional, Set, Tuple
 import logging
-from datetime import datetime
+import time
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Word tokens used for whole-word keyword matching
+TOKEN_PATTERN = re.compile(r'\\w+')
+
+# Cached routing decision: (selected module, scores, matched patterns, reason, confidence)
+RoutingDecision = Tuple[str, Tuple[Tuple[str, int], ...], Tuple[Tuple[str, Tuple[str, ...]], ...], str, float]
 
 # Import all AI modules
 from rag_module import RAGModule
@@ -15,56 +36,101 @@ from kag_module import KAGModule
 from cag_module import CAGModule
 from slm_module import SLMModule
 
+# Configure logging once per process and share one logger per module
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
 class AgentController:
     """
     Central controller that analyzes user queries and routes them to the most appropriate
     AI module (RAG, KAG, CAG, or SLM) for optimal response generation.
     """
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the agent controller with all AI modules."""
-        # Initialize all AI modules
-        try:
-            self.rag_module = RAGModule()
-            self.rag_available = True
-        except Exception as e:
-            print(f"Warning: RAG module initialization failed: {e}")
-            self.rag_available = False
+        self.logger = logger
         
-        try:
-            self.kag_module = KAGModule()
-            self.kag_available = True
-        except Exception as e:
-            print(f"Warning: KAG module initialization failed: {e}")
-            self.kag_available = False
-        
-        try:
-            self.cag_module = CAGModule()
-            self.cag_available = True
-        except Exception as e:
-            print(f"Warning: CAG module initialization failed: {e}")
-            self.cag_available = False
+        # AI modules are created on first use (RAG loads the embedding model and FAISS index)
+        self._module_factories = {
+            'RAG': RAGModule,
+            'KAG': KAGModule,
+            'CAG': CAGModule,
+            'SLM': SLMModule
+        }
+        self._modules = {name: None for name in self._module_factories}
+        self.available = {name: True for name in self._module_factories}
+        self._init_locks = {name: threading.Lock() for name in self._module_factories}
         
-        try:
-            self.slm_module = SLMModule()
-            self.slm_available = True
-        except Exception as e:
-            print(f"Warning: SLM module initialization failed: {e}")
-            self.slm_available = False
+        # Bound (get_response, format_response) pairs, filled as modules are created
+        self._dispatch = {}
         
         # Query routing patterns
         self.routing_patterns = self._initialize_routing_patterns()
+        self.keyword_automaton = self._build_keyword_automaton()
+        self.pattern_index = [(module, pattern)
+                              for module, config in self.routing_patterns.items()
+                              for pattern in config['patterns']]
+        self.pattern_database = self._build_pattern_database()
         
-        # Setup logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
+        # Routing only depends on the lowercased query, so repeated queries are memoized
+        self._analyze_query_cached = functools.lru_cache(maxsize=2048)(self._score_query)
         
         print("🤖 CivicMindAI Agent Controller initialized successfully!")
-        print(f"Available modules: RAG({self.rag_available}), KAG({self.kag_available}), CAG({self.cag_available}), SLM({self.slm_available})")
+        print(f"Modules loaded on first use: {', '.join(self._module_factories)}")
+    
+    def _get(self, name: str) -> Optional[Any]:
+        """
+        Get an AI module, creating it on first use.
+        
+        Args:
+            name (str): Module name (RAG, KAG, CAG or SLM)
+            
+        Returns:
+            Module instance or None if it failed to initialize
+        """
+        if not self.available.get(name, False):
+            return None
+        
+        module = self._modules.get(name)
+        if module is None:
+            # The controller is shared across sessions; build each module only once
+            with self._init_locks[name]:
+                module = self._modules.get(name)
+                if module is None:
+                    if not self.available[name]:
+                        return None
+                    try:
+                        module = self._module_factories[name]()
+                    except Exception as e:
+                        print(f"Warning: {name} module initialization failed: {e}")
+                        self.available[name] = False
+                        return None
+                    self._modules[name] = module
+        
+        return module
+    
+    def _get_handlers(self, name: str) -> Optional[Tuple[Callable, Callable]]:
+        """
+        Get the bound response handlers of an AI module, creating it on first use.
+        
+        Args:
+            name (str): Module name (RAG, KAG, CAG or SLM)
+            
+        Returns:
+            Tuple of (get_response, format_response) or None if the module is unavailable
+        """
+        handlers = self._dispatch.get(name)
+        if handlers is None:
+            module = self._get(name)
+            if module is None:
+                return None
+            handlers = self._dispatch[name] = (module.get_response, module.format_response)
+        return handlers
     
     def _initialize_routing_patterns(self) -> Dict[str, Dict[str, Any]]:
         """Initialize patterns for routing queries to appropriate modules."""
-        return {
+        routing_patterns = {
             'CAG': {
                 'keywords': [
                     'helpline', 'contact', 'number', 'phone', 'emergency', 
@@ -127,38 +193,184 @@ class AgentController:
                 'description': 'General chat, greetings, identity questions'
             }
         }
+        
+        # Precompile regex patterns once; raw strings are kept for routing explanations.
+        # Single-word keywords are matched against query tokens, phrases by substring.
+        for config in routing_patterns.values():
+            config['compiled'] = [(pattern, re.compile(pattern)) for pattern in config['patterns']]
+            config['single_keywords'] = frozenset(k for k in config['keywords'] if ' ' not in k)
+            config['phrase_keywords'] = [k for k in config['keywords'] if ' ' in k]
+            config['keyword_rank'] = {k: rank for rank, k in enumerate(config['keywords'])}
+        
+        return routing_patterns
+    
+    def _build_keyword_automaton(self) -> Optional[Any]:
+        """Build a single Aho-Corasick automaton over the keyword phrases of all modules."""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        # The same phrase can route to several modules
+        keyword_entries = {}
+        for module, config in self.routing_patterns.items():
+            for keyword in config['phrase_keywords']:
+                keyword_entries.setdefault(keyword, []).append((module, keyword))
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, entries in keyword_entries.items():
+            automaton.add_word(keyword, tuple(entries))
+        automaton.make_automaton()
+        return automaton
+    
+    def _build_pattern_database(self) -> Optional[Any]:
+        """Compile the regex patterns of all modules into a single Hyperscan database."""
+        if not HYPERSCAN_AVAILABLE:
+            return None
+        
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[pattern.encode() for _, pattern in self.pattern_index],
+                ids=list(range(len(self.pattern_index))),
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(self.pattern_index)
+            )
+            return database
+        except hyperscan.error as e:
+            print(f"Warning: Hyperscan compilation failed, using Python regex: {e}")
+            return None
+    
+    def _match_patterns(self, query_lower: str) -> List[Tuple[str, str]]:
+        """
+        Find all routing regex patterns that match the query.
+        
+        Args:
+            query_lower (str): Lowercased user query
+            
+        Returns:
+            List of (module, pattern) pairs in routing-pattern order
+        """
+        # Hyperscan only has ASCII \\b, \\w and \\s (it rejects \\b in UCP mode), so anything
+        # beyond printable ASCII uses the Unicode-aware re loop and both paths agree
+        if self.pattern_database is None or not (query_lower.isascii() and query_lower.isprintable()):
+            return [(module, pattern)
+                    for module, config in self.routing_patterns.items()
+                    for pattern, compiled in config['compiled']
+                    if compiled.search(query_lower)]
+        
+        # Single scan over the query for all patterns; each pattern reports at most once
+        hits: Set[int] = set()
+        
+        def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+            hits.add(pattern_id)
+        
+        self.pattern_database.scan(query_lower.encode(), match_event_handler=on_match)
+        return [self.pattern_index[pattern_id] for pattern_id in sorted(hits)]
+    
+    def _match_keywords(self, query_lower: str, tokens: Set[str]) -> List[Tuple[str, str]]:
+        """
+        Find all routing keywords contained in the query.
+        
+        Single-word keywords must match a whole query token, so 'hi' no longer
+        matches inside 'this'. Multi-word phrases are matched as substrings.
+        
+        Args:
+            query_lower (str): Lowercased user query
+            tokens (Set[str]): Word tokens of the query
+            
+        Returns:
+            List of (module, keyword) pairs in routing-pattern order
+        """
+        # Phrases: one automaton pass when available, substring scans otherwise
+        phrase_hits: Set[Tuple[str, str]]
+        if self.keyword_automaton is None:
+            phrase_hits = {(module, keyword)
+                           for module, config in self.routing_patterns.items()
+                           for keyword in config['phrase_keywords']
+                           if keyword in query_lower}
+        else:
+            phrase_hits = set()
+            for _, entries in self.keyword_automaton.iter(query_lower):
+                phrase_hits.update(entries)
+        
+        matches: List[Tuple[str, str]] = []
+        for module, config in self.routing_patterns.items():
+            module_hits = tokens & config['single_keywords']
+            module_hits.update(keyword for hit_module, keyword in phrase_hits if hit_module == module)
+            matches.extend((module, keyword) for keyword in sorted(module_hits, key=config['keyword_rank'].get))
+        return matches
     
-    def analyze_query(self, query: str) -> Dict[str, Any]:
+    def analyze_query(self, query: str, query_lower: Optional[str] = None) -> Dict[str, Any]:
         """
         Analyze the user query to determine the best AI module to use.
         
         Args:
             query (str): User query to analyze
+            query_lower (str, optional): Precomputed lowercase form of the query
             
         Returns:
             Dict containing analysis results and routing decision
         """
-        query_lower = query.lower()
-        scores = {'CAG': 0, 'RAG': 0, 'KAG': 0, 'SLM': 0}
-        matched_patterns = {'CAG': [], 'RAG': [], 'KAG': [], 'SLM': []}
+        if query_lower is None:
+            query_lower = query.lower()
+        selected_module, scores, matched_patterns, reason, confidence = self._analyze_query_cached(query_lower)
+        
+        # Fresh containers so callers can't mutate the cached result
+        return {
+            'selected_module': selected_module,
+            'scores': dict(scores),
+            'matched_patterns': {module: list(matches) for module, matches in matched_patterns},
+            'reason': reason,
+            'confidence': confidence
+        }
+    
+    def predict_module(self, query: str, query_lower: Optional[str] = None) -> str:
+        """
+        Predict which module a query will be routed to, without running it.
+        
+        Args:
+            query (str): User query
+            query_lower (str, optional): Precomputed lowercase form of the query
+            
+        Returns:
+            str: Name of the module route_query would use
+        """
+        if query_lower is None:
+            query_lower = query.lower()
+        selected_module = self._analyze_query_cached(query_lower)[0]
+        return selected_module if self.available[selected_module] else 'SLM'
+    
+    def _score_query(self, query_lower: str) -> RoutingDecision:
+        """
+        Score a lowercased query against the routing patterns of every module.
+        
+        Args:
+            query_lower (str): Lowercased user query
+            
+        Returns:
+            Tuple of (selected module, scores, matched patterns, reason, confidence)
+        """
+        scores: Dict[str, int] = {'CAG': 0, 'RAG': 0, 'KAG': 0, 'SLM': 0}
+        matched_patterns: Dict[str, List[str]] = {'CAG': [], 'RAG': [], 'KAG': [], 'SLM': []}
+        
+        # Every keyword and pattern needs a word character, so queries without
+        # word tokens (emoji, punctuation) cannot score and skip matching entirely
+        tokens = set(TOKEN_PATTERN.findall(query_lower))
         
         # Score each module based on keyword and pattern matches
-        for module, config in self.routing_patterns.items():
-            # Keyword matching
-            for keyword in config['keywords']:
-                if keyword in query_lower:
-                    scores[module] += 1
-                    matched_patterns[module].append(f"keyword: {keyword}")
+        if tokens:
+            for module, keyword in self._match_keywords(query_lower, tokens):
+                scores[module] += 1
+                matched_patterns[module].append(f"keyword: {keyword}")
             
-            # Pattern matching
-            for pattern in config['patterns']:
-                if re.search(pattern, query_lower):
-                    scores[module] += 2  # Patterns get higher weight
-                    matched_patterns[module].append(f"pattern: {pattern}")
+            for module, pattern in self._match_patterns(query_lower):
+                scores[module] += 2  # Patterns get higher weight
+                matched_patterns[module].append(f"pattern: {pattern}")
         
-        # Determine the best module
-        best_module = max(scores, key=scores.get)
-        best_score = scores[best_module]
+        # Determine the best module and total score in a single pass (ties keep the first module)
+        best_module, best_score, total_score = 'SLM', 0, 0
+        for module, score in scores.items():
+            total_score += score
+            if score > best_score:
+                best_module, best_score = module, score
         
         # If no clear winner, use fallback logic
         if best_score == 0:
@@ -167,13 +379,13 @@ class AgentController:
         else:
             reason = f"Highest score ({best_score}) with patterns: {matched_patterns[best_module]}"
         
-        return {
-            'selected_module': best_module,
-            'scores': scores,
-            'matched_patterns': matched_patterns,
-            'reason': reason,
-            'confidence': best_score / max(sum(scores.values()), 1)
-        }
+        return (
+            best_module,
+            tuple(scores.items()),
+            tuple((module, tuple(matches)) for module, matches in matched_patterns.items()),
+            reason,
+            best_score / max(total_score, 1)
+        )
     
     def route_query(self, query: str) -> Dict[str, Any]:
         """
@@ -185,43 +397,37 @@ class AgentController:
         Returns:
             Dict containing response from selected module
         """
-        # Analyze query to determine routing
-        analysis = self.analyze_query(query)
+        # Analyze query to determine routing; the lowercase form is shared with the modules
+        query_lower = query.lower()
+        analysis = self.analyze_query(query, query_lower=query_lower)
         selected_module = analysis['selected_module']
         
         self.logger.info(f"Routing query to {selected_module}: {analysis['reason']}")
         
         # Route to selected module
         try:
-            if selected_module == 'CAG' and self.cag_available:
-                response = self.cag_module.get_response(query)
-                formatted_response = self.cag_module.format_response(response)
-                
-            elif selected_module == 'RAG' and self.rag_available:
-                response = self.rag_module.get_response(query)
-                formatted_response = self.rag_module.format_response(response)
-                
-            elif selected_module == 'KAG' and self.kag_available:
-                response = self.kag_module.get_response(query)
-                formatted_response = self.kag_module.format_response(response)
-                
-            elif selected_module == 'SLM' and self.slm_available:
-                response = self.slm_module.get_response(query)
-                formatted_response = self.slm_module.format_response(response)
+            handlers = self._get_handlers(selected_module)
+            
+            # Fallback if selected module is not available
+            if handlers is None and selected_module != 'SLM':
+                handlers = self._get_handlers('SLM')
+                selected_module = 'SLM'
+            
+            if handlers is not None:
+                get_response, format_response = handlers
+                if selected_module == 'SLM':
+                    response = get_response(query, query_lower=query_lower)
+                else:
+                    response = get_response(query)
+                formatted_response = format_response(response)
                 
             else:
-                # Fallback if selected module is not available
-                if self.slm_available:
-                    response = self.slm_module.get_response(query)
-                    formatted_response = self.slm_module.format_response(response)
-                    selected_module = 'SLM'
-                else:
-                    response = {
-                        'success': False,
-                        'source': 'Controller',
-                        'error': 'No modules available'
-                    }
-                    formatted_response = "I apologize, but I'm currently unable to process your request. Please try again later."
+                response = {
+                    'success': False,
+                    'source': 'Controller',
+                    'error': 'No modules available'
+                }
+                formatted_response = "I apologize, but I'm currently unable to process your request. Please try again later."
             
             # Add routing information to response
             controller_response = {
@@ -230,7 +436,7 @@ class AgentController:
                 'selected_module': selected_module,
                 'routing_analysis': analysis,
                 'module_response': response,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.time_ns()
             }
             
             return controller_response
@@ -243,34 +449,28 @@ class AgentController:
                 'selected_module': selected_module,
                 'routing_analysis': analysis,
                 'error': str(e),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.time_ns()
             }
     
     def get_module_status(self) -> Dict[str, Any]:
-        """Get status of all AI modules."""
+        """Get status of all AI modules ('loaded', 'not loaded' until first use, or 'failed')."""
+        modules = {}
+        for name, available in self.available.items():
+            if not available:
+                state = 'failed'
+            elif self._modules[name] is not None:
+                state = 'loaded'
+            else:
+                state = 'not loaded'
+            modules[name] = {
+                'available': state == 'loaded',
+                'state': state,
+                'description': self.routing_patterns[name]['description']
+            }
         return {
-            'modules': {
-                'RAG': {
-                    'available': self.rag_available,
-                    'description': self.routing_patterns['RAG']['description']
-                },
-                'KAG': {
-                    'available': self.kag_available,
-                    'description': self.routing_patterns['KAG']['description']
-                },
-                'CAG': {
-                    'available': self.cag_available,
-                    'description': self.routing_patterns['CAG']['description']
-                },
-                'SLM': {
-                    'available': self.slm_available,
-                    'description': self.routing_patterns['SLM']['description']
-                }
-            },
-            'total_available': sum([
-                self.rag_available, self.kag_available, 
-                self.cag_available, self.slm_available
-            ]),
+            'modules': modules,
+            'total_available': sum(info['available'] for info in modules.values()),
+            'total_modules': len(modules),
             'controller_status': 'Active'
         }
     
@@ -286,22 +486,25 @@ class AgentController:
         """
         analysis = self.analyze_query(query)
         
-        explanation = f"**Query Analysis for:** '{query}'\\n\\n"
-        explanation += f"**Selected Module:** {analysis['selected_module']}\\n"
-        explanation += f"**Confidence:** {analysis['confidence']:.2%}\\n\\n"
-        
-        explanation += "**Module Scores:**\\n"
+        # Collect lines and join once instead of growing a string with +=
+        lines = [
+            f"**Query Analysis for:** '{query}'",
+            "",
+            f"**Selected Module:** {analysis['selected_module']}",
+            f"**Confidence:** {analysis['confidence']:.2%}",
+            "",
+            "**Module Scores:**"
+        ]
         for module, score in analysis['scores'].items():
-            status = "✅" if score > 0 else "❌" 
-            explanation += f"{status} {module}: {score} points\\n"
-        
-        explanation += f"\\n**Reason:** {analysis['reason']}\\n\\n"
+            status = "✅" if score > 0 else "❌"
+            lines.append(f"{status} {module}: {score} points")
         
-        explanation += "**Module Capabilities:**\\n"
+        lines.extend(["", f"**Reason:** {analysis['reason']}", "", "**Module Capabilities:**"])
         for module, config in self.routing_patterns.items():
-            explanation += f"• **{module}**: {config['description']}\\n"
+            lines.append(f"• **{module}**: {config['description']}")
+        lines.append("")
         
-        return explanation
+        return "\\n".join(lines)
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -334,8 +537,7 @@ if __name__ == "__main__":
         print("-" * 70)
 '''
 
-with open('CivicMindAI/agent_controller.py', 'w') as f:
-    f.write(agent_controller_code)
+Path(os.sep.join(('CivicMindAI', 'agent_controller.py'))).write_text(agent_controller_code, encoding='utf-8', newline='\n')
 
 print("✅ Agent Controller module created!")
 print("Features implemented:")
@@ -6,6 +6,7 @@ Chennai Civic Assistant Chatbot with Multi-Modal AI Integration
 
 import streamlit as st
 import time
+from collections import deque
 from datetime import datetime
 import json
 import os
@@ -28,7 +29,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better UI
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     .main-header {
         background: linear-gradient(90deg, #1f4e79 0%, #2980b9 100%);
@@ -39,53 +40,6 @@ st.markdown("""
         text-align: center;
     }
     
-    .chat-message {
-        padding: 1rem;
-        border-radius: 10px;
-        margin: 0.5rem 0;
-        border-left: 4px solid #2980b9;
-    }
-    
-    .user-message {
-        background-color: #e3f2fd;
-        border-left-color: #1976d2;
-        margin-left: 2rem;
-    }
-    
-    .bot-message {
-        background-color: #f8f9fa;
-        border-left-color: #2980b9;
-        margin-right: 2rem;
-    }
-    
-    .module-tag {
-        display: inline-block;
-        padding: 0.2rem 0.5rem;
-        border-radius: 15px;
-        font-size: 0.8rem;
-        font-weight: bold;
-        margin-bottom: 0.5rem;
-    }
-    
-    .tag-rag { background-color: #e8f5e8; color: #2e7d32; }
-    .tag-kag { background-color: #fff3e0; color: #f57c00; }
-    .tag-cag { background-color: #f3e5f5; color: #7b1fa2; }
-    .tag-slm { background-color: #e1f5fe; color: #0277bd; }
-    
-    .status-indicator {
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-        margin: 0.5rem 0;
-    }
-    
-    .status-dot {
-        width: 10px;
-        height: 10px;
-        border-radius: 50%;
-        background-color: #4caf50;
-    }
-    
     .typing-indicator {
         display: flex;
         align-items: center;
@@ -116,40 +70,116 @@ st.markdown("""
         0%, 60%, 100% { transform: translateY(0); }
         30% { transform: translateY(-10px); }
     }
+</style>
+"""
+
+# Sidebar icon for each AgentController module state
+MODULE_STATE_ICONS = {'loaded': "✅", 'not loaded': "⏳", 'failed': "❌"}
+
+@st.cache_resource(show_spinner="🤖 Initializing CivicMindAI...")
+def _get_controller() -> Any:
+    """
+    Build the agent controller once per process and share it across sessions.
     
-    .feedback-buttons {
-        display: flex;
-        gap: 0.5rem;
-        margin-top: 0.5rem;
-    }
+    Returns:
+        AgentController: Shared controller instance
+    """
+    return AgentController()
+
+# Modules whose answers depend only on the normalized query; SLM replies may come from
+# OpenAI and RAG results carry retrieval times, so neither is shared across sessions
+CACHEABLE_MODULES = frozenset({'CAG', 'KAG'})
+
+class UncachedResponse(Exception):
+    """Carries a controller response out of _cached_route without caching it."""
     
-    .stat-card {
-        background: white;
-        padding: 1rem;
-        border-radius: 8px;
-        border-left: 4px solid #2980b9;
-        margin: 0.5rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+    def __init__(self, response: Dict[str, Any]):
+        super().__init__(response.get('error', 'response not cacheable'))
+        self.response = response
+
+@st.cache_data(ttl=300, max_entries=500)
+def _cached_route(query_norm: str, controller_id: int, _controller: Any) -> Dict[str, Any]:
+    """
+    Route a normalized query, reusing the response for repeats of the same text.
+    
+    The normalized text is routed, not the query as typed, so a cached response
+    never echoes another session's wording.
+    
+    Args:
+        query_norm (str): Stripped, lowercased query used as the cache key
+        controller_id (int): id() of the controller, used as the cache key
+        _controller (AgentController): Controller to route through (not hashed)
+        
+    Returns:
+        Dict containing the controller response
+        
+    Raises:
+        UncachedResponse: If routing failed or fell back to a module outside
+            CACHEABLE_MODULES, so the response is not memoized
+    """
+    response = _controller.route_query(query_norm)
+    if not response.get('success', False) or response['selected_module'] not in CACHEABLE_MODULES:
+        raise UncachedResponse(response)
+    return response
+
+def route_with_cache(controller: Any, query: str) -> Dict[str, Any]:
+    """
+    Route a query, using the response cache for CAG and KAG queries.
+    
+    Args:
+        controller (AgentController): Controller to route through
+        query (str): Query as typed by the user
+        
+    Returns:
+        Dict containing the controller response
+    """
+    if controller.predict_module(query) not in CACHEABLE_MODULES:
+        return controller.route_query(query)
+    try:
+        return _cached_route(query.strip().lower(), id(controller), controller)
+    except UncachedResponse as e:
+        return e.response
+
+@st.cache_data(ttl=30)
+def _cached_module_status(controller_id: int, _controller: Any) -> Dict[str, Any]:
+    """
+    Get module status, recomputed at most every 30 seconds per controller.
+    
+    Args:
+        controller_id (int): id() of the controller, used as the cache key
+        _controller (AgentController): Controller to query (not hashed)
+        
+    Returns:
+        Dict containing module status information
+    """
+    return _controller.get_module_status()
+
+def inject_css():
+    """
+    Inject the custom CSS into the current run.
+    
+    Streamlit drops elements that are not re-emitted on a rerun, so this must
+    be called once per run rather than once per session.
+    """
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 class CivicMindAIApp:
     """Main Streamlit application class for CivicMindAI."""
     
     def __init__(self):
         """Initialize the application."""
+        inject_css()
         self.initialize_session_state()
         
         # Initialize controller if available
         if CONTROLLER_AVAILABLE:
             if 'controller' not in st.session_state:
-                with st.spinner("🤖 Initializing CivicMindAI..."):
-                    try:
-                        st.session_state.controller = AgentController()
-                        st.session_state.controller_status = "Ready"
-                    except Exception as e:
-                        st.session_state.controller = None
-                        st.session_state.controller_status = f"Error: {str(e)}"
+                try:
+                    st.session_state.controller = _get_controller()
+                    st.session_state.controller_status = "Ready"
+                except Exception as e:
+                    st.session_state.controller = None
+                    st.session_state.controller_status = f"Error: {str(e)}"
         else:
             st.session_state.controller = None
             st.session_state.controller_status = "Controller not available"
@@ -166,7 +196,8 @@ class CivicMindAIApp:
             st.session_state.session_start = datetime.now()
         
         if 'feedback_data' not in st.session_state:
-            st.session_state.feedback_data = []
+            # Bounded so long-running sessions keep only the latest feedback
+            st.session_state.feedback_data = deque(maxlen=1000)
     
     def render_header(self):
         """Render the application header."""
@@ -186,14 +217,17 @@ class CivicMindAIApp:
             # Controller Status
             if st.session_state.controller:
                 st.success("✅ CivicMindAI Ready")
-                status = st.session_state.controller.get_module_status()
+                controller = st.session_state.controller
+                status = _cached_module_status(id(controller), controller)
                 
                 st.subheader("AI Modules")
                 for module, info in status['modules'].items():
-                    icon = "✅" if info['available'] else "❌"
+                    icon = MODULE_STATE_ICONS[info['state']]
                     st.write(f"{icon} **{module}**: {info['description']}")
+                    if info['state'] == 'not loaded':
+                        st.caption("Loads on first query routed to it")
                 
-                st.metric("Available Modules", f"{status['total_available']}/4")
+                st.metric("Loaded Modules", f"{status['total_available']}/{status['total_modules']}")
             else:
                 st.error("❌ Controller Unavailable")
                 st.write(st.session_state.controller_status)
@@ -203,8 +237,9 @@ class CivicMindAIApp:
             st.metric("Queries Processed", st.session_state.query_count)
             st.metric("Messages", len(st.session_state.messages))
             
-            session_duration = datetime.now() - st.session_state.session_start
-            st.metric("Session Duration", f"{session_duration.seconds // 60}m {session_duration.seconds % 60}s")
+            session_duration = self._now - st.session_state.session_start
+            minutes, seconds = divmod(session_duration.seconds, 60)
+            st.metric("Session Duration", f"{minutes}m {seconds}s")
             
             # Controls
             st.subheader("🛠️ Controls")
@@ -248,67 +283,49 @@ class CivicMindAIApp:
                 - Real-time web updates
                 """)
     
-    def get_module_tag_html(self, module: str) -> str:
-        """Generate HTML for module tag."""
-        tag_classes = {
-            'RAG': 'tag-rag',
-            'KAG': 'tag-kag', 
-            'CAG': 'tag-cag',
-            'SLM': 'tag-slm'
-        }
-        
-        tag_class = tag_classes.get(module, 'tag-slm')
-        return f'<span class="module-tag {tag_class}">{module}</span>'
+    def format_caption(self, message: Dict[str, Any]) -> str:
+        """Build the module tag and response time caption for a bot message."""
+        details = []
+        if 'module' in message:
+            details.append(f"**{message['module']}**")
+        if 'response_time' in message:
+            details.append(f"⏱️ {message['response_time']}ms")
+        return " • ".join(details)
     
-    def render_message(self, message: Dict[str, Any], is_user: bool = False):
-        """Render a chat message."""
-        if is_user:
-            with st.container():
-                st.markdown(f"""
-                <div class="chat-message user-message">
-                    <strong>You:</strong><br>
-                    {message['content']}
-                </div>
-                """, unsafe_allow_html=True)
-        else:
-            with st.container():
-                # Module tag
-                module_tag = ""
-                if 'module' in message:
-                    module_tag = self.get_module_tag_html(message['module'])
-                
-                # Response time
-                response_time = ""
-                if 'response_time' in message:
-                    response_time = f"<small style='color: #666;'>⏱️ {message['response_time']}ms</small>"
-                
-                st.markdown(f"""
-                <div class="chat-message bot-message">
-                    {module_tag}
-                    <strong>CivicMindAI:</strong><br>
-                    {message['content']}
-                    <br><br>
-                    {response_time}
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Feedback buttons (simplified for demo)
-                col1, col2, col3 = st.columns([1, 1, 8])
+    def render_message(self, message: Dict[str, Any], is_user: bool = False, msg_index: int = 0):
+        """Render a chat message at position msg_index in the history."""
+        with st.chat_message("user" if is_user else "assistant"):
+            st.markdown(message['content'])
+            
+            if is_user:
+                return
+            
+            # Module tag and response time share one caption line, built once per message
+            caption = message.get('caption')
+            if caption is None:
+                caption = self.format_caption(message)
+            if caption:
+                st.caption(caption)
+            
+            # Feedback buttons (simplified for demo)
+            if message.get('show_feedback', True):
+                key_suffix = f"{msg_index}_{message.get('timestamp', 0)}"
+                col1, col2 = st.columns([1, 1])
                 with col1:
-                    if st.button("👍", key=f"like_{len(st.session_state.messages)}_{message.get('timestamp', 0)}"):
+                    if st.button("👍", key=f"like_{key_suffix}"):
                         st.session_state.feedback_data.append({
-                            'message_id': len(st.session_state.messages),
+                            'message_id': msg_index,
                             'feedback': 'positive',
-                            'timestamp': datetime.now().isoformat()
+                            'timestamp': time.time_ns()
                         })
                         st.success("Thank you for your feedback!")
                 
                 with col2:
-                    if st.button("👎", key=f"dislike_{len(st.session_state.messages)}_{message.get('timestamp', 0)}"):
+                    if st.button("👎", key=f"dislike_{key_suffix}"):
                         st.session_state.feedback_data.append({
-                            'message_id': len(st.session_state.messages),
+                            'message_id': msg_index,
                             'feedback': 'negative', 
-                            'timestamp': datetime.now().isoformat()
+                            'timestamp': time.time_ns()
                         })
                         st.info("Thank you for your feedback!")
     
@@ -331,15 +348,16 @@ class CivicMindAIApp:
             return {
                 'content': "I apologize, but the AI system is currently unavailable. Please try again later.",
                 'module': 'ERROR',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': time.time_ns(),
                 'response_time': 0
             }
         
         try:
             start_time = time.time()
             
-            # Route query through controller
-            controller_response = st.session_state.controller.route_query(query)
+            # Route query through controller; repeated FAQ queries are served from cache
+            controller = st.session_state.controller
+            controller_response = route_with_cache(controller, query)
             
             end_time = time.time()
             response_time = int((end_time - start_time) * 1000)  # Convert to milliseconds
@@ -357,24 +375,23 @@ class CivicMindAIApp:
             return {
                 'content': f"I encountered an error processing your request: {str(e)}",
                 'module': 'ERROR',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': time.time_ns(),
                 'response_time': 0
             }
     
     def run(self):
         """Run the main application."""
+        # One clock snapshot shared by everything rendered in this run
+        self._now = datetime.now()
+        
         self.render_header()
-        self.render_sidebar()
         
         # Main chat interface
         st.header("💬 Chat Interface")
         
         # Display chat messages
-        for message in st.session_state.messages:
-            if message['role'] == 'user':
-                self.render_message(message, is_user=True)
-            else:
-                self.render_message(message, is_user=False)
+        for msg_index, message in enumerate(st.session_state.messages):
+            self.render_message(message, is_user=message['role'] == 'user', msg_index=msg_index)
         
         # Chat input
         with st.container():
@@ -385,21 +402,22 @@ class CivicMindAIApp:
                 user_message = {
                     'role': 'user',
                     'content': query,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': time.time_ns()
                 }
                 st.session_state.messages.append(user_message)
+                self.render_message(user_message, is_user=True,
+                                    msg_index=len(st.session_state.messages) - 1)
                 
-                # Show typing indicator
+                # Show typing indicator, except for cache hits that answer instantly
                 typing_placeholder = st.empty()
-                with typing_placeholder:
-                    self.show_typing_indicator()
+                controller = st.session_state.controller
+                if controller and controller.predict_module(query) != 'CAG':
+                    with typing_placeholder:
+                        self.show_typing_indicator()
                 
                 # Process query
                 response = self.process_query(query)
                 
-                # Remove typing indicator
-                typing_placeholder.empty()
-                
                 # Add bot response
                 bot_message = {
                     'role': 'assistant',
@@ -408,16 +426,20 @@ class CivicMindAIApp:
                     'timestamp': response['timestamp'],
                     'response_time': response.get('response_time', 0)
                 }
+                bot_message['caption'] = self.format_caption(bot_message)
                 st.session_state.messages.append(bot_message)
                 
+                # Swap the typing indicator for the reply in place
+                with typing_placeholder.container():
+                    self.render_message(bot_message, is_user=False,
+                                        msg_index=len(st.session_state.messages) - 1)
+                
                 # Update query count
                 st.session_state.query_count += 1
-                
-                # Rerun to update the display
-                st.rerun()
         
-        # Welcome message for new users
-        if len(st.session_state.messages) == 0:
+        # Welcome message for new users (re-emitted each run until the first query,
+        # since Streamlit drops elements a rerun does not render)
+        if not st.session_state.messages:
             st.info("""
             👋 **Welcome to CivicMindAI!**
             
@@ -433,6 +455,9 @@ class CivicMindAIApp:
             
             **Try asking:** "Fire emergency number" or "How to pay property tax online?"
             """)
+        
+        # Sidebar last so session stats include this turn
+        self.render_sidebar()
 
 # Application entry point
 def main():
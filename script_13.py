@@ -12,6 +12,8 @@ setup_instructions = '''# CivicMindAI - Setup and Deployment Guide
 2. **Install Dependencies**
    ```bash
    pip install -r requirements.txt
+   # Optional accelerators; hyperscan needs libhs to build, and the app falls back without them
+   pip install -r requirements-optional.txt
    ```
 
 3. **Set Environment Variables (Optional)**
@@ -43,7 +45,8 @@ CivicMindAI/
 │   ├── civic_docs/         # Sample Chennai civic documents
 │   ├── civic_knowledge.json # Structured knowledge graph data
 │   ├── civic_cache.json    # Cached frequently-asked information
-└── requirements.txt        # Python dependencies
+├── requirements.txt        # Python dependencies
+└── requirements-optional.txt # Optional accelerators
 ```
 
 ## 🤖 AI Modules Overview
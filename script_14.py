@@ -32,7 +32,7 @@ CivicMindAI/
    • Document chunking and ranking
 
 2. 🧠 KAG (Knowledge-Augmented Generation)
-   • NetworkX knowledge graph with 28 entities
+   • Directed knowledge graph with 28 entities
    • Multi-hop reasoning for complex queries
    • Step-by-step procedure guidance
    • Department responsibility mapping
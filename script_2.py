@@ -1,4 +1,11 @@
 # Create civic_cache.json with Chennai civic information
+import json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 civic_cache = {
     "emergency_contacts": {
         "fire": "101",
@@ -51,11 +58,20 @@ civic_cache = {
     }
 }
 
-with open('CivicMindAI/data/civic_cache.json', 'w') as f:
-    json.dump(civic_cache, f, indent=2)
+def build_cache():
+    """Write civic_cache.json and print a summary of its categories."""
+    if ORJSON_AVAILABLE:
+        with open('CivicMindAI/data/civic_cache.json', 'wb') as f:
+            f.write(orjson.dumps(civic_cache, option=orjson.OPT_INDENT_2))
+    else:
+        with open('CivicMindAI/data/civic_cache.json', 'w') as f:
+            json.dump(civic_cache, f, indent=2)
+
+    print("✅ Civic cache data created successfully!")
+    print(f"Cache contains {len(civic_cache)} main categories:")
+    for category in civic_cache.keys():
+        print(f"  • {category.replace('_', ' ').title()}")
+        print(f"    - {len(civic_cache[category])} entries")
 
-print("✅ Civic cache data created successfully!")
-print(f"Cache contains {len(civic_cache)} main categories:")
-for category in civic_cache.keys():
-    print(f"  • {category.replace('_', ' ').title()}")
-    print(f"    - {len(civic_cache[category])} entries")
\ No newline at end of file
+if __name__ == "__main__":
+    build_cache()
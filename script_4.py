@@ -1,4 +1,8 @@
 # Create sample civic documents for RAG module
+from pathlib import Path
+
+from civic_docs_data import write_docs
+
 civic_docs = {
     "water_supply_guidelines.txt": """
 CHENNAI METRO WATER SUPPLY AND SEWERAGE BOARD
@@ -246,15 +250,15 @@ EMERGENCY PROTOCOLS:
 }
 
 # Create civic documents directory and files
-os.makedirs('CivicMindAI/data/civic_docs', exist_ok=True)
+docs_dir = Path('CivicMindAI/data/civic_docs')
+docs_dir.mkdir(parents=True, exist_ok=True)
+
+write_docs(docs_dir, civic_docs)
 
+# Emit the summary with a single write
+summary = ["✅ Sample civic documents created successfully!",
+           f"Created {len(civic_docs)} documents:"]
 for filename, content in civic_docs.items():
-    with open(f'CivicMindAI/data/civic_docs/{filename}', 'w') as f:
-        f.write(content)
-
-print("✅ Sample civic documents created successfully!")
-print(f"Created {len(civic_docs)} documents:")
-for filename in civic_docs.keys():
-    print(f"  • {filename}")
-    word_count = len(civic_docs[filename].split())
-    print(f"    - {word_count} words")
\ No newline at end of file
+    summary.append(f"  • {filename}")
+    summary.append(f"    - {len(content.split())} words")
+print("\n".join(summary))
\ No newline at end of file
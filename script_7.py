@@ -6,8 +6,144 @@ Provides instant responses for frequently asked civic information using cached d
 
 import json
 import os
-from typing import Dict, Any, Optional
+import re
+import sys
+import functools
+from typing import Dict, Any, Callable, List, Optional, Set, Tuple
 import logging
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Configure logging once per process and share one logger per module
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Category trigger words; search_cache checks the categories in this order
+EMERGENCY_TRIGGERS = frozenset({'emergency', 'helpline', 'contact', 'phone', 'number'})
+GOVERNMENT_TRIGGERS = frozenset({'office', 'collector', 'mayor', 'government'})
+SERVICE_TRIGGERS = frozenset({'tax', 'certificate', 'license', 'permit'})
+ZONE_TRIGGERS = frozenset({'zone', 'area', 'ward', 'anna nagar', 'adyar'})
+QUICK_INFO_TRIGGERS = frozenset({'timing', 'hours', 'schedule', 'website'})
+
+# (keyword, cache key) pairs for each category, in match priority order
+EMERGENCY_KEYWORDS = (
+    ('fire', 'fire'),
+    ('police', 'police'),
+    ('ambulance', 'ambulance'),
+    ('medical', 'ambulance'),
+    ('hospital', 'ambulance'),
+    ('flood', 'flood_helpline'),
+    ('water emergency', 'cmwssb_complaint'),
+    ('electricity', 'electricity_complaint'),
+    ('gas', 'gas_leak'),
+    ('women', 'women_helpline'),
+    ('child', 'child_helpline'),
+    ('corporation', 'chennai_corporation'),
+)
+
+GOV_KEYWORDS = (
+    ('collector', 'collector_office'),
+    ('mayor', 'mayor_office'),
+    ('district', 'district_collector'),
+    ('cm', 'cm_cell'),
+    ('chief minister', 'cm_cell'),
+    ('police control', 'tn_police_control'),
+)
+
+SERVICE_KEYWORDS = (
+    ('property tax', 'property_tax'),
+    ('water tax', 'water_tax'),
+    ('birth certificate', 'birth_certificate'),
+    ('death certificate', 'death_certificate'),
+    ('trade license', 'trade_license'),
+    ('building permit', 'building_permit'),
+    ('marriage', 'marriage_registration'),
+)
+
+ZONE_KEYWORDS = (
+    ('north', 'zone_1_north'),
+    ('north east', 'zone_2_north_east'),
+    ('central', 'zone_3_central'),
+    ('south west', 'zone_4_south_west'),
+    ('south', 'zone_5_south'),
+    ('adyar', 'zone_6_adyar'),
+    ('anna nagar', 'zone_7_anna_nagar'),
+    ('teynampet', 'zone_8_teynampet'),
+)
+
+INFO_KEYWORDS = (
+    ('office hours', 'corporation_office_hours'),
+    ('timing', 'corporation_office_hours'),
+    ('water supply', 'water_supply_timings'),
+    ('garbage', 'garbage_collection'),
+    ('tax due', 'property_tax_due_date'),
+    ('website', ('corporation_website', 'cmwssb_website')),
+)
+
+# Emergency services reachable around the clock
+ALWAYS_AVAILABLE_CONTACTS = frozenset({'fire', 'police', 'ambulance'})
+
+# Formatters for each cached response type, dispatched by format_response
+def _format_emergency_contact(data: Dict[str, Any]) -> str:
+    return f"🚨 **{data['service']} Emergency**\\n" \\
+           f"📞 **Contact:** {data['number']}\\n" \\
+           f"⏰ **Availability:** {data['availability']}"
+
+def _format_government_contact(data: Dict[str, Any]) -> str:
+    return f"🏛️ **{data['office']}**\\n" \\
+           f"📞 **Contact:** {data['number']}\\n" \\
+           f"⏰ **Timing:** {data['timing']}"
+
+def _format_civic_service(data: Dict[str, Any]) -> str:
+    return f"📋 **{data['service']}**\\n" \\
+           f"📞 **Helpline:** {data['helpline']}\\n" \\
+           f"⏰ **Timing:** {data['timing']}"
+
+def _format_zone_contact(data: Dict[str, Any]) -> str:
+    return f"📍 **{data['zone']} Zone**\\n" \\
+           f"📞 **Contact:** {data['contact']}\\n" \\
+           f"🔧 **Services:** {data['services']}"
+
+def _format_quick_info(data: Dict[str, Any]) -> str:
+    return f"ℹ️ **{data['info_type']}**\\n" \\
+           f"📝 **Details:** {data['details']}"
+
+def _format_websites(data: Dict[str, Any]) -> str:
+    websites_text = "\\n".join([f"• {name.replace('_', ' ').title()}: {url}" 
+                             for name, url in data['websites'].items()])
+    return f"🌐 **Official Websites:**\\n{websites_text}"
+
+def _format_all_emergency_contacts(data: Dict[str, Any]) -> str:
+    contacts_text = "\\n".join([f"• {name.replace('_', ' ').title()}: {number}" 
+                              for name, number in data['contacts'].items()])
+    return f"🚨 **All Emergency Contacts:**\\n{contacts_text}"
+
+def _format_default(data: Dict[str, Any]) -> str:
+    return f"✅ Information retrieved from cache: {str(data)}"
+
+RESPONSE_FORMATTERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    'emergency_contact': _format_emergency_contact,
+    'government_contact': _format_government_contact,
+    'civic_service': _format_civic_service,
+    'zone_contact': _format_zone_contact,
+    'quick_info': _format_quick_info,
+    'websites': _format_websites,
+    'all_emergency_contacts': _format_all_emergency_contacts,
+}
 
 class CAGModule:
     """
@@ -22,25 +158,137 @@ class CAGModule:
         Args:
             cache_file_path (str): Path to the cache JSON file
         """
+        self.logger = logger
         self.cache_file_path = cache_file_path
         self.cache_data = {}
+        
+        # Responses depend only on the normalized query and the loaded cache; errors propagate and are not cached
+        self._get_response_cached = functools.lru_cache(maxsize=4096)(self._build_response)
         self.load_cache()
         
-        # Setup logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
+        # Every trigger and lookup keyword, matched against a query in one pass
+        self.keywords = sorted(
+            EMERGENCY_TRIGGERS | GOVERNMENT_TRIGGERS | SERVICE_TRIGGERS | ZONE_TRIGGERS | QUICK_INFO_TRIGGERS |
+            {keyword for table in (EMERGENCY_KEYWORDS, GOV_KEYWORDS, SERVICE_KEYWORDS, ZONE_KEYWORDS, INFO_KEYWORDS)
+             for keyword, _ in table}
+        )
+        self.keyword_database = self._build_keyword_database()
+        self.keyword_automaton = self._build_keyword_automaton() if self.keyword_database is None else None
     
     def load_cache(self) -> None:
         """Load cached data from JSON file."""
         try:
             if os.path.exists(self.cache_file_path):
-                with open(self.cache_file_path, 'r') as f:
-                    self.cache_data = json.load(f)
+                # Parse raw bytes; orjson skips the text decode and is much faster on cold start
+                with open(self.cache_file_path, 'rb') as f:
+                    raw = f.read()
+                self.cache_data = self._intern_keys(orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw))
                 self.logger.info(f"Cache loaded successfully with {len(self.cache_data)} categories")
             else:
                 self.logger.warning(f"Cache file not found at {self.cache_file_path}")
         except Exception as e:
             self.logger.error(f"Error loading cache: {str(e)}")
+        
+        # Category sections looked up by the _search_* helpers, resolved once per load
+        self._emergency_contacts = self.cache_data.get('emergency_contacts', {})
+        self._government_contacts = self.cache_data.get('government_contacts', {})
+        self._civic_services = self.cache_data.get('civic_services_helplines', {})
+        self._zone_contacts = self.cache_data.get('zone_contacts', {})
+        self._quick_info = self.cache_data.get('quick_info', {})
+        
+        # Memoized answers were built from the previous cache data
+        self._get_response_cached.cache_clear()
+    
+    @staticmethod
+    def _intern_keys(value: Any) -> Any:
+        """
+        Recursively intern dictionary keys of parsed cache data.
+        
+        Lookups use string literals such as 'fire' or 'zone_1_north', which the
+        compiler interns, so interned keys hit the identity fast path in dict lookups.
+        
+        Args:
+            value: Parsed JSON value
+            
+        Returns:
+            The same structure with interned dictionary keys
+        """
+        if isinstance(value, dict):
+            return {sys.intern(key): CAGModule._intern_keys(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [CAGModule._intern_keys(item) for item in value]
+        return value
+    
+    def _build_keyword_automaton(self) -> Optional[Any]:
+        """Build a single Aho-Corasick automaton over all cache keywords."""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in self.keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
+    def _build_keyword_database(self) -> Optional[Any]:
+        """Compile all cache keywords into a single Hyperscan literal database."""
+        if not HYPERSCAN_AVAILABLE:
+            return None
+        
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[re.escape(keyword).encode() for keyword in self.keywords],
+                ids=list(range(len(self.keywords))),
+                # UTF-8 mode scans the encoded query by code point, as the Python fallbacks do
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP] * len(self.keywords)
+            )
+            return database
+        except hyperscan.error as e:
+            print(f"Warning: Hyperscan compilation failed, using Python matching: {e}")
+            return None
+    
+    def _match_keywords(self, query_lower: str) -> Set[str]:
+        """
+        Find every cache keyword that occurs in a query.
+        
+        Args:
+            query_lower (str): Lowercased user query
+            
+        Returns:
+            Set of matched keywords
+        """
+        if self.keyword_database is not None:
+            # Single DFA scan; each keyword reports at most once
+            hits: Set[str] = set()
+            
+            def on_match(keyword_id: int, start: int, end: int, flags: int, context: Any) -> None:
+                hits.add(self.keywords[keyword_id])
+            
+            self.keyword_database.scan(query_lower.encode(), match_event_handler=on_match)
+            return hits
+        if self.keyword_automaton is not None:
+            return {keyword for _, keyword in self.keyword_automaton.iter(query_lower)}
+        return {keyword for keyword in self.keywords if keyword in query_lower}
+    
+    @staticmethod
+    def _ordered_matches(keywords: Tuple[Tuple[str, Any], ...], matched: Set[str]) -> List[Tuple[str, Any]]:
+        """
+        List matched (keyword, cache key) pairs of one table in priority order.
+        
+        A keyword that only matched as part of a longer matched keyword
+        ('north' inside 'north east') is left out.
+        
+        Args:
+            keywords (Tuple): (keyword, cache key) pairs of one category
+            matched (Set[str]): Keywords found in the query
+            
+        Returns:
+            List of matched (keyword, cache key) pairs from the table
+        """
+        candidates = [(keyword, key) for keyword, key in keywords if keyword in matched]
+        return [(keyword, key) for keyword, key in candidates
+                if not any(keyword != other and keyword in other for other, _ in candidates)]
     
     def search_cache(self, query: str) -> Optional[Dict[str, Any]]:
         """
@@ -53,57 +301,46 @@ class CAGModule:
             Dict containing cached information or None if not found
         """
         query_lower = query.lower()
+        matched = self._match_keywords(query_lower)
+        if not matched:
+            return None
         
         # Emergency contact searches
-        if any(keyword in query_lower for keyword in ['emergency', 'helpline', 'contact', 'phone', 'number']):
-            return self._search_emergency_contacts(query_lower)
+        if not matched.isdisjoint(EMERGENCY_TRIGGERS):
+            return self._search_emergency_contacts(query_lower, matched)
         
         # Government office searches
-        if any(keyword in query_lower for keyword in ['office', 'collector', 'mayor', 'government']):
-            return self._search_government_contacts(query_lower)
+        if not matched.isdisjoint(GOVERNMENT_TRIGGERS):
+            return self._search_government_contacts(query_lower, matched)
         
         # Civic service searches  
-        if any(keyword in query_lower for keyword in ['tax', 'certificate', 'license', 'permit']):
-            return self._search_civic_services(query_lower)
+        if not matched.isdisjoint(SERVICE_TRIGGERS):
+            return self._search_civic_services(query_lower, matched)
         
         # Zone-specific searches
-        if any(keyword in query_lower for keyword in ['zone', 'area', 'ward', 'anna nagar', 'adyar']):
-            return self._search_zone_info(query_lower)
+        if not matched.isdisjoint(ZONE_TRIGGERS):
+            return self._search_zone_info(query_lower, matched)
         
         # Quick info searches
-        if any(keyword in query_lower for keyword in ['timing', 'hours', 'schedule', 'website']):
-            return self._search_quick_info(query_lower)
+        if not matched.isdisjoint(QUICK_INFO_TRIGGERS):
+            return self._search_quick_info(query_lower, matched)
             
         return None
     
-    def _search_emergency_contacts(self, query: str) -> Optional[Dict[str, Any]]:
+    def _search_emergency_contacts(self, query: str, matched: Optional[Set[str]] = None) -> Optional[Dict[str, Any]]:
         """Search emergency contacts based on query."""
-        emergency_keywords = {
-            'fire': 'fire',
-            'police': 'police', 
-            'ambulance': 'ambulance',
-            'medical': 'ambulance',
-            'hospital': 'ambulance',
-            'flood': 'flood_helpline',
-            'water emergency': 'cmwssb_complaint',
-            'electricity': 'electricity_complaint',
-            'gas': 'gas_leak',
-            'women': 'women_helpline',
-            'child': 'child_helpline',
-            'corporation': 'chennai_corporation'
-        }
+        if matched is None:
+            matched = self._match_keywords(query)
+        emergency_data = self._emergency_contacts
         
-        emergency_data = self.cache_data.get('emergency_contacts', {})
-        
-        for keyword, contact_key in emergency_keywords.items():
-            if keyword in query:
-                if contact_key in emergency_data:
-                    return {
-                        'type': 'emergency_contact',
-                        'service': keyword.title(),
-                        'number': emergency_data[contact_key],
-                        'availability': '24x7' if contact_key in ['fire', 'police', 'ambulance'] else 'Office hours'
-                    }
+        for keyword, contact_key in self._ordered_matches(EMERGENCY_KEYWORDS, matched):
+            if contact_key in emergency_data:
+                return {
+                    'type': 'emergency_contact',
+                    'service': keyword.title(),
+                    'number': emergency_data[contact_key],
+                    'availability': '24x7' if contact_key in ALWAYS_AVAILABLE_CONTACTS else 'Office hours'
+                }
         
         # Return all emergency contacts if general emergency query
         if 'emergency' in query and 'all' in query:
@@ -114,112 +351,77 @@ class CAGModule:
             
         return None
     
-    def _search_government_contacts(self, query: str) -> Optional[Dict[str, Any]]:
+    def _search_government_contacts(self, query: str, matched: Optional[Set[str]] = None) -> Optional[Dict[str, Any]]:
         """Search government office contacts."""
-        gov_data = self.cache_data.get('government_contacts', {})
-        
-        gov_keywords = {
-            'collector': 'collector_office',
-            'mayor': 'mayor_office', 
-            'district': 'district_collector',
-            'cm': 'cm_cell',
-            'chief minister': 'cm_cell',
-            'police control': 'tn_police_control'
-        }
+        if matched is None:
+            matched = self._match_keywords(query)
+        gov_data = self._government_contacts
         
-        for keyword, contact_key in gov_keywords.items():
-            if keyword in query:
-                if contact_key in gov_data:
-                    return {
-                        'type': 'government_contact',
-                        'office': keyword.title(),
-                        'number': gov_data[contact_key],
-                        'timing': 'Office hours (9:30 AM - 5:30 PM)'
-                    }
+        for keyword, contact_key in self._ordered_matches(GOV_KEYWORDS, matched):
+            if contact_key in gov_data:
+                return {
+                    'type': 'government_contact',
+                    'office': keyword.title(),
+                    'number': gov_data[contact_key],
+                    'timing': 'Office hours (9:30 AM - 5:30 PM)'
+                }
         
         return None
     
-    def _search_civic_services(self, query: str) -> Optional[Dict[str, Any]]:
+    def _search_civic_services(self, query: str, matched: Optional[Set[str]] = None) -> Optional[Dict[str, Any]]:
         """Search civic service helplines."""
-        services_data = self.cache_data.get('civic_services_helplines', {})
-        
-        service_keywords = {
-            'property tax': 'property_tax',
-            'water tax': 'water_tax',
-            'birth certificate': 'birth_certificate',
-            'death certificate': 'death_certificate',
-            'trade license': 'trade_license',
-            'building permit': 'building_permit',
-            'marriage': 'marriage_registration'
-        }
+        if matched is None:
+            matched = self._match_keywords(query)
+        services_data = self._civic_services
         
-        for keyword, service_key in service_keywords.items():
-            if keyword in query:
-                if service_key in services_data:
-                    return {
-                        'type': 'civic_service',
-                        'service': keyword.title(),
-                        'helpline': services_data[service_key],
-                        'timing': 'Office hours'
-                    }
+        for keyword, service_key in self._ordered_matches(SERVICE_KEYWORDS, matched):
+            if service_key in services_data:
+                return {
+                    'type': 'civic_service',
+                    'service': keyword.title(),
+                    'helpline': services_data[service_key],
+                    'timing': 'Office hours'
+                }
         
         return None
     
-    def _search_zone_info(self, query: str) -> Optional[Dict[str, Any]]:
+    def _search_zone_info(self, query: str, matched: Optional[Set[str]] = None) -> Optional[Dict[str, Any]]:
         """Search zone-specific contact information."""
-        zones_data = self.cache_data.get('zone_contacts', {})
-        
-        zone_keywords = {
-            'north': 'zone_1_north',
-            'north east': 'zone_2_north_east', 
-            'central': 'zone_3_central',
-            'south west': 'zone_4_south_west',
-            'south': 'zone_5_south',
-            'adyar': 'zone_6_adyar',
-            'anna nagar': 'zone_7_anna_nagar',
-            'teynampet': 'zone_8_teynampet'
-        }
+        if matched is None:
+            matched = self._match_keywords(query)
+        zones_data = self._zone_contacts
         
-        for keyword, zone_key in zone_keywords.items():
-            if keyword in query:
-                if zone_key in zones_data:
-                    return {
-                        'type': 'zone_contact',
-                        'zone': keyword.title(),
-                        'contact': zones_data[zone_key],
-                        'services': 'Water supply, complaints, maintenance'
-                    }
+        for keyword, zone_key in self._ordered_matches(ZONE_KEYWORDS, matched):
+            if zone_key in zones_data:
+                return {
+                    'type': 'zone_contact',
+                    'zone': keyword.title(),
+                    'contact': zones_data[zone_key],
+                    'services': 'Water supply, complaints, maintenance'
+                }
         
         return None
     
-    def _search_quick_info(self, query: str) -> Optional[Dict[str, Any]]:
+    def _search_quick_info(self, query: str, matched: Optional[Set[str]] = None) -> Optional[Dict[str, Any]]:
         """Search quick information like timings, schedules."""
-        quick_data = self.cache_data.get('quick_info', {})
-        
-        info_keywords = {
-            'office hours': 'corporation_office_hours',
-            'timing': 'corporation_office_hours',
-            'water supply': 'water_supply_timings',
-            'garbage': 'garbage_collection',
-            'tax due': 'property_tax_due_date',
-            'website': ['corporation_website', 'cmwssb_website']
-        }
-        
-        for keyword, info_key in info_keywords.items():
-            if keyword in query:
-                if isinstance(info_key, list):
-                    # Multiple websites
-                    websites = {k: quick_data.get(k) for k in info_key if k in quick_data}
-                    return {
-                        'type': 'websites',
-                        'websites': websites
-                    }
-                elif info_key in quick_data:
-                    return {
-                        'type': 'quick_info',
-                        'info_type': keyword.title(),
-                        'details': quick_data[info_key]
-                    }
+        if matched is None:
+            matched = self._match_keywords(query)
+        quick_data = self._quick_info
+        
+        for keyword, info_key in self._ordered_matches(INFO_KEYWORDS, matched):
+            if isinstance(info_key, tuple):
+                # Multiple websites
+                websites = {k: quick_data.get(k) for k in info_key if k in quick_data}
+                return {
+                    'type': 'websites',
+                    'websites': websites
+                }
+            elif info_key in quick_data:
+                return {
+                    'type': 'quick_info',
+                    'info_type': keyword.title(),
+                    'details': quick_data[info_key]
+                }
         
         return None
     
@@ -234,23 +436,8 @@ class CAGModule:
             Dict containing response data and metadata
         """
         try:
-            cached_result = self.search_cache(query)
-            
-            if cached_result:
-                return {
-                    'success': True,
-                    'data': cached_result,
-                    'source': 'CAG',
-                    'response_time': 'Instant',
-                    'message': f'Retrieved from cache: {cached_result["type"]}'
-                }
-            else:
-                return {
-                    'success': False,
-                    'data': None,
-                    'source': 'CAG',
-                    'message': 'No cached information found for this query'
-                }
+            # Civic queries repeat heavily and differ at most in case and spacing
+            return dict(self._get_response_cached(" ".join(query.lower().split())))
                 
         except Exception as e:
             self.logger.error(f"Error in CAG response: {str(e)}")
@@ -261,6 +448,33 @@ class CAGModule:
                 'error': str(e)
             }
     
+    def _build_response(self, norm_query: str) -> Dict[str, Any]:
+        """
+        Build the response for a normalized query (memoized per instance).
+        
+        Args:
+            norm_query (str): Lowercased query with whitespace collapsed
+            
+        Returns:
+            Dict containing response data and metadata
+        """
+        cached_result = self.search_cache(norm_query)
+        
+        if cached_result:
+            return {
+                'success': True,
+                'data': cached_result,
+                'source': 'CAG',
+                'response_time': 'Instant',
+                'message': f'Retrieved from cache: {cached_result["type"]}'
+            }
+        return {
+            'success': False,
+            'data': None,
+            'source': 'CAG',
+            'message': 'No cached information found for this query'
+        }
+    
     def format_response(self, response_data: Dict[str, Any]) -> str:
         """
         Format the cached response into user-friendly text.
@@ -275,44 +489,7 @@ class CAGModule:
             return "I couldn't find that information in my cache. Let me search other sources for you."
         
         data = response_data['data']
-        response_type = data.get('type', '')
-        
-        if response_type == 'emergency_contact':
-            return f"🚨 **{data['service']} Emergency**\\n" \\
-                   f"📞 **Contact:** {data['number']}\\n" \\
-                   f"⏰ **Availability:** {data['availability']}"
-        
-        elif response_type == 'government_contact':
-            return f"🏛️ **{data['office']}**\\n" \\
-                   f"📞 **Contact:** {data['number']}\\n" \\
-                   f"⏰ **Timing:** {data['timing']}"
-        
-        elif response_type == 'civic_service':
-            return f"📋 **{data['service']}**\\n" \\
-                   f"📞 **Helpline:** {data['helpline']}\\n" \\
-                   f"⏰ **Timing:** {data['timing']}"
-        
-        elif response_type == 'zone_contact':
-            return f"📍 **{data['zone']} Zone**\\n" \\
-                   f"📞 **Contact:** {data['contact']}\\n" \\
-                   f"🔧 **Services:** {data['services']}"
-        
-        elif response_type == 'quick_info':
-            return f"ℹ️ **{data['info_type']}**\\n" \\
-                   f"📝 **Details:** {data['details']}"
-        
-        elif response_type == 'websites':
-            websites_text = "\\n".join([f"• {name.replace('_', ' ').title()}: {url}" 
-                                     for name, url in data['websites'].items()])
-            return f"🌐 **Official Websites:**\\n{websites_text}"
-        
-        elif response_type == 'all_emergency_contacts':
-            contacts_text = "\\n".join([f"• {name.replace('_', ' ').title()}: {number}" 
-                                      for name, number in data['contacts'].items()])
-            return f"🚨 **All Emergency Contacts:**\\n{contacts_text}"
-        
-        else:
-            return f"✅ Information retrieved from cache: {str(data)}"
+        return RESPONSE_FORMATTERS.get(data.get('type', ''), _format_default)(data)
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -6,15 +6,57 @@ Retrieves and grounds responses from civic documents, reports, and live web cont
 
 import os
 import json
-from typing import List, Dict, Any, Optional
+import hashlib
+import functools
+import pickle
+from typing import List, Dict, Any, Optional, Tuple
 import logging
+import time
 from datetime import datetime
+
+# Threads for BLAS/OpenMP math in numpy, the encoder and FAISS. The OMP_NUM_THREADS default only
+# takes effect if this module is imported before numpy; FAISS is also set explicitly after its import
+NUM_THREADS = min(8, os.cpu_count() or 1)
+os.environ.setdefault('OMP_NUM_THREADS', str(NUM_THREADS))
+
 import numpy as np
-from sentence_transformers import SentenceTransformer
-import faiss
 import requests
 from bs4 import BeautifulSoup
 
+# Configure logging once per process and share one logger per module
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Turns document filenames such as water_supply.txt into display names
+UNDERSCORE_TO_SPACE = str.maketrans('_', ' ')
+
+# Maximum characters per document chunk
+CHUNK_SIZE = 500
+
+# Chunks per encoder forward pass when embedding the corpus
+ENCODE_BATCH_SIZE = 64
+
+# Switch from exact search to an HNSW graph once the corpus is large enough to pay off
+HNSW_MIN_VECTORS = 1000
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+
+# Bump when the persisted index or chunk format changes so old caches are not reused
+INDEX_CACHE_VERSION = 1
+
+# sentence-transformers (torch) and faiss take seconds to import, so they load with the first RAGModule
+SentenceTransformer = None
+faiss = None
+
+def _import_backends() -> None:
+    """Import the embedding and vector search libraries on first use."""
+    global SentenceTransformer, faiss
+    if faiss is None:
+        from sentence_transformers import SentenceTransformer
+        import faiss
+
 class RAGModule:
     """
     Retrieval-Augmented Generation module that searches through civic documents
@@ -30,8 +72,10 @@ class RAGModule:
             docs_path (str): Path to civic documents directory
             model_name (str): Name of sentence transformer model
         """
+        self.logger = logger
         self.docs_path = docs_path
         self.model_name = model_name
+        _import_backends()
         
         # Initialize embedding model
         try:
@@ -42,18 +86,22 @@ class RAGModule:
             self.embedding_model = None
             self.embedding_dim = 384  # Default dimension
         
+        # Parallelize FAISS search across cores, whether or not OpenMP saw OMP_NUM_THREADS in time
+        faiss.omp_set_num_threads(NUM_THREADS)
+        
+        # Query embeddings are memoized as bytes (ndarrays are not hashable or immutable)
+        self._embed_query_cached = functools.lru_cache(maxsize=1024)(self._embed_query)
+        
         # Document storage
         self.documents = []
         self.embeddings = []
         self.index = None
         
-        # Load and index documents
-        self.load_documents()
-        self.create_index()
-        
-        # Setup logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
+        # Load and index documents, unless an index for this exact corpus is on disk
+        if not self._load_index_cache():
+            self.load_documents()
+            self.create_index()
+            self._save_index_cache()
     
     def load_documents(self) -> None:
         """Load all civic documents from the specified directory."""
@@ -62,22 +110,23 @@ class RAGModule:
                 self.logger.warning(f"Documents directory not found: {self.docs_path}")
                 return
             
-            for filename in os.listdir(self.docs_path):
-                if filename.endswith('.txt'):
-                    file_path = os.path.join(self.docs_path, filename)
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Split document into chunks
-                    chunks = self._split_document(content, filename)
-                    self.documents.extend(chunks)
+            with os.scandir(self.docs_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.txt') and entry.is_file():
+                        # One read into a bytes buffer; decoding once is cheaper than a text-mode reader
+                        with open(entry.path, 'rb') as f:
+                            content = f.read().decode('utf-8')
+                        
+                        # Split document into chunks
+                        chunks = self._split_document(content, entry.name)
+                        self.documents.extend(chunks)
             
             self.logger.info(f"Loaded {len(self.documents)} document chunks")
             
         except Exception as e:
             self.logger.error(f"Error loading documents: {str(e)}")
     
-    def _split_document(self, content: str, filename: str, chunk_size: int = 500) -> List[Dict[str, Any]]:
+    def _split_document(self, content: str, filename: str, chunk_size: int = CHUNK_SIZE) -> List[Dict[str, Any]]:
         """
         Split document content into smaller chunks for better retrieval.
         
@@ -93,29 +142,35 @@ class RAGModule:
         paragraphs = content.split('\\n\\n')
         chunks = []
         
-        current_chunk = ""
+        # Collect paragraphs and join once per chunk; size counts the "\\n\\n" separators
+        current_parts = []
+        current_size = 0
         chunk_id = 0
         
         for paragraph in paragraphs:
-            if len(current_chunk + paragraph) < chunk_size:
-                current_chunk += paragraph + "\\n\\n"
+            if current_size + len(paragraph) < chunk_size:
+                current_parts.append(paragraph)
+                current_size += len(paragraph) + 2
             else:
-                if current_chunk.strip():
+                current_chunk = "\\n\\n".join(current_parts).strip()
+                if current_chunk:
                     chunks.append({
                         'id': f"{filename}_{chunk_id}",
-                        'content': current_chunk.strip(),
+                        'content': current_chunk,
                         'source': filename,
                         'chunk_id': chunk_id,
                         'timestamp': datetime.now().isoformat()
                     })
                     chunk_id += 1
-                current_chunk = paragraph + "\\n\\n"
+                current_parts = [paragraph]
+                current_size = len(paragraph) + 2
         
         # Add the last chunk
-        if current_chunk.strip():
+        current_chunk = "\\n\\n".join(current_parts).strip()
+        if current_chunk:
             chunks.append({
                 'id': f"{filename}_{chunk_id}",
-                'content': current_chunk.strip(),
+                'content': current_chunk,
                 'source': filename,
                 'chunk_id': chunk_id,
                 'timestamp': datetime.now().isoformat()
@@ -134,20 +189,134 @@ class RAGModule:
             texts = [doc['content'] for doc in self.documents]
             
             if self.embedding_model:
-                self.embeddings = self.embedding_model.encode(texts)
+                self.embeddings = self.embedding_model.encode(
+                    texts, batch_size=ENCODE_BATCH_SIZE, convert_to_numpy=True,
+                    normalize_embeddings=True, show_progress_bar=False
+                )
             else:
-                # Mock embeddings for testing when model is not available
-                self.embeddings = np.random.rand(len(texts), self.embedding_dim)
+                # Deterministic mock embeddings for testing when model is not available
+                self.embeddings = np.zeros((len(texts), self.embedding_dim), dtype=np.float32)
             
-            # Create FAISS index
-            self.index = faiss.IndexFlatIP(self.embedding_dim)
-            self.index.add(self.embeddings.astype('float32'))
+            # Unit vectors make inner product cosine similarity; fp16 storage halves
+            # the bytes streamed per search with negligible loss in ranking quality
+            embeddings = self.embeddings.astype('float32')
+            if len(embeddings) < HNSW_MIN_VECTORS:
+                # Brute force is already fast here and skips the graph build
+                self.index = faiss.IndexScalarQuantizer(
+                    self.embedding_dim, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_INNER_PRODUCT
+                )
+            else:
+                # HNSW graph over the same fp16 vectors: O(log N) search instead of a full scan
+                self.index = faiss.IndexHNSWSQ(
+                    self.embedding_dim, faiss.ScalarQuantizer.QT_fp16, HNSW_M, faiss.METRIC_INNER_PRODUCT
+                )
+                self.index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+                self.index.hnsw.efSearch = HNSW_EF_SEARCH
+            self.index.train(embeddings)
+            self.index.add(embeddings)
             
             self.logger.info(f"Created FAISS index with {len(self.embeddings)} vectors")
             
         except Exception as e:
             self.logger.error(f"Error creating index: {str(e)}")
     
+    def _corpus_signature(self) -> Optional[str]:
+        """
+        Hash the document set, embedding model and index settings into a cache key.
+        
+        Returns:
+            str: Hex digest identifying the corpus, or None if it cannot be read
+        """
+        try:
+            entries = sorted(
+                (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+                for entry in os.scandir(self.docs_path)
+                if entry.name.endswith('.txt')
+            )
+        except OSError:
+            return None
+        index_config = ['fp16', HNSW_MIN_VECTORS, HNSW_M, HNSW_EF_CONSTRUCTION, HNSW_EF_SEARCH]
+        payload = [INDEX_CACHE_VERSION, self.model_name, CHUNK_SIZE, index_config, entries]
+        return hashlib.sha1(json.dumps(payload).encode('utf-8')).hexdigest()
+    
+    def _index_cache_paths(self) -> Optional[Tuple[str, str]]:
+        """Return the (index, documents) cache file paths for the current corpus."""
+        signature = self._corpus_signature()
+        if signature is None:
+            return None
+        cache_dir = os.path.join(os.path.dirname(os.path.normpath(self.docs_path)), '.rag_cache')
+        base = os.path.join(cache_dir, signature)
+        return f"{base}.faiss", f"{base}.pkl"
+    
+    def _load_index_cache(self) -> bool:
+        """
+        Load a persisted FAISS index and its document chunks.
+        
+        Returns:
+            bool: True if the cache was loaded and indexing can be skipped
+        """
+        # Mock embeddings carry no information, so there is nothing worth reusing
+        if not self.embedding_model:
+            return False
+        
+        paths = self._index_cache_paths()
+        if paths is None or not all(os.path.exists(path) for path in paths):
+            return False
+        
+        index_path, documents_path = paths
+        try:
+            index = faiss.read_index(index_path)
+            with open(documents_path, 'rb') as f:
+                documents = pickle.load(f)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable RAG index cache: {str(e)}")
+            return False
+        
+        self.index = index
+        self.documents = documents
+        self.logger.info(f"Loaded cached FAISS index with {self.index.ntotal} vectors")
+        return True
+    
+    def _save_index_cache(self) -> None:
+        """Persist the FAISS index and document chunks for the next start."""
+        if not self.embedding_model or self.index is None:
+            return
+        
+        paths = self._index_cache_paths()
+        if paths is None:
+            return
+        
+        index_path, documents_path = paths
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            faiss.write_index(self.index, index_path)
+            with open(documents_path, 'wb') as f:
+                pickle.dump(self.documents, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            self.logger.warning(f"Could not write RAG index cache: {str(e)}")
+            return
+        
+        # Entries for earlier corpora or settings can never match again
+        cache_dir = os.path.dirname(index_path)
+        for entry in os.scandir(cache_dir):
+            if entry.name.endswith(('.faiss', '.pkl')) and entry.path not in paths:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+    
+    def _embed_query(self, query: str) -> bytes:
+        """
+        Embed a query with the sentence transformer.
+        
+        Args:
+            query (str): Whitespace-normalized query
+            
+        Returns:
+            bytes: Raw float32 buffer of the normalized query embedding
+        """
+        return self.embedding_model.encode([query], normalize_embeddings=True).astype('float32').tobytes()
+    
     def search_documents(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """
         Search for relevant documents based on query.
@@ -165,23 +334,26 @@ class RAGModule:
         try:
             # Generate query embedding
             if self.embedding_model:
-                query_embedding = self.embedding_model.encode([query])
+                # Whitespace does not change the tokens, so repeats share one forward pass
+                query_embedding = np.frombuffer(
+                    self._embed_query_cached(" ".join(query.split())), dtype=np.float32
+                ).reshape(1, self.embedding_dim)
             else:
-                # Mock embedding for testing
-                query_embedding = np.random.rand(1, self.embedding_dim)
+                # Deterministic mock embedding for testing
+                query_embedding = np.zeros((1, self.embedding_dim), dtype=np.float32)
             
             # Search in FAISS index
             scores, indices = self.index.search(query_embedding.astype('float32'), top_k)
             
-            results = []
-            for i, (score, idx) in enumerate(zip(scores[0], indices[0])):
-                if idx < len(self.documents):  # Valid index
-                    doc = self.documents[idx].copy()
-                    doc['score'] = float(score)
-                    doc['rank'] = i + 1
-                    results.append(doc)
-            
-            return results
+            # FAISS pads missing neighbours with -1; mask and convert in one vectorized pass
+            valid = (indices[0] >= 0) & (indices[0] < len(self.documents))
+            documents = self.documents
+            return [
+                {**documents[idx], 'score': score, 'rank': rank}
+                for rank, (idx, score) in enumerate(
+                    zip(indices[0][valid].tolist(), scores[0][valid].tolist()), start=1
+                )
+            ]
             
         except Exception as e:
             self.logger.error(f"Error searching documents: {str(e)}")
@@ -262,7 +434,7 @@ class RAGModule:
                     'data': all_results,
                     'source': 'RAG',
                     'query': query,
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': time.time_ns(),
                     'message': f'Found {all_results["total_sources"]} relevant sources'
                 }
             else:
@@ -303,7 +475,7 @@ class RAGModule:
         if data['documents']:
             formatted_text += "📄 **From Official Documents:**\\n"
             for doc in data['documents'][:2]:  # Show top 2 documents
-                source_name = doc['source'].replace('.txt', '').replace('_', ' ').title()
+                source_name = doc['source'].replace('.txt', '').translate(UNDERSCORE_TO_SPACE).title()
                 content_preview = doc['content'][:200] + "..." if len(doc['content']) > 200 else doc['content']
                 formatted_text += f"• **{source_name}**: {content_preview}\\n\\n"
         
@@ -349,7 +521,8 @@ print("✅ RAG (Retrieval-Augmented Generation) module created!")
 print("Features implemented:")
 print("  • Document loading and chunking")
 print("  • Sentence transformer embeddings")
-print("  • FAISS vector similarity search")
+print("  • FAISS vector similarity search (fp16, cosine)")
+print("  • On-disk index cache keyed by corpus signature")
 print("  • Web search simulation")
 print("  • Multi-source result ranking")
 print("  • Response formatting with sources")
@@ -6,10 +6,147 @@ Performs reasoning over structured civic knowledge using Knowledge Graphs.
 
 import json
 import os
-from typing import Dict, Any, List, Optional, Tuple
+import sys
+import functools
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
 import logging
-from datetime import datetime
-import networkx as nx
+import time
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Configure logging once per process and share one logger per module
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# (keyword, procedure id) pairs; the longest (most specific) matching keyword wins
+PROCEDURE_KEYWORDS = tuple(sorted((
+    ('water connection', 'water_connection_new'),
+    ('new water connection', 'water_connection_new'),
+    ('apply water', 'water_connection_new'),
+    ('property tax', 'property_tax_payment'),
+    ('pay tax', 'property_tax_payment'),
+    ('tax payment', 'property_tax_payment'),
+    ('street light', 'street_light_repair'),
+    ('light repair', 'street_light_repair'),
+    ('street lamp', 'street_light_repair'),
+    ('birth certificate', 'birth_certificate'),
+    ('birth cert', 'birth_certificate'),
+), key=lambda entry: len(entry[0]), reverse=True))
+
+# (keyword, issue ids) pairs based on the knowledge graph; the longest matching keyword wins
+ISSUE_KEYWORDS = tuple(sorted((
+    ('water', ('no_water', 'water_contamination', 'pipeline_leak')),
+    ('sewage', ('sewage_overflow', 'blocked_drain')),
+    ('garbage', ('garbage_not_collected',)),
+    ('waste', ('garbage_not_collected',)),
+    ('street light', ('street_light_not_working',)),
+    ('road', ('pothole',)),
+    ('electricity', ('power_cut',)),
+    ('power', ('power_cut',)),
+), key=lambda entry: len(entry[0]), reverse=True))
+
+# Prebuilt reasoning chains, e.g. "How to get water pipeline repaired in Anna Nagar?"
+WATER_REPAIR_STEPS = (
+    {
+        'step': 1,
+        'action': 'Identify Issue',
+        'result': 'Water pipeline repair needed',
+        'node': 'pipeline_leak'
+    },
+    {
+        'step': 2,
+        'action': 'Find Responsible Service',
+        'result': 'Water Supply Service',
+        'node': 'water_supply'
+    },
+    {
+        'step': 3,
+        'action': 'Find Responsible Department',
+        'result': 'Chennai Metro Water Supply and Sewerage Board (CMWSSB)',
+        'node': 'cmwssb'
+    },
+    {
+        'step': 4,
+        'action': 'Get Contact Information',
+        'result': 'Call CMWSSB complaint cell: 044-45674567',
+        'details': 'Available 24x7 for emergency repairs'
+    },
+)
+
+# Area-specific step added when the area is mentioned
+ANNA_NAGAR_STEP = {
+    'step': 5,
+    'action': 'Area-specific Contact',
+    'result': 'Anna Nagar falls under North Zone',
+    'details': 'Zone contact: 044-28451300 Ext.233'
+}
+
+PROPERTY_TAX_STEPS = (
+    {
+        'step': 1,
+        'action': 'Identify Service',
+        'result': 'Property Tax Payment',
+        'node': 'property_tax'
+    },
+    {
+        'step': 2,
+        'action': 'Find Department',
+        'result': 'Greater Chennai Corporation (GCC)',
+        'node': 'gcc'
+    },
+    {
+        'step': 3,
+        'action': 'Get Procedure',
+        'result': 'Online payment procedure available',
+        'node': 'property_tax_payment'
+    },
+)
+
+# (all of, any of, steps, (keyword, extra step) pairs) per multi-hop intent, checked in order
+MULTI_HOP_CHAINS = (
+    (frozenset({'repair'}), frozenset({'water', 'pipeline'}), WATER_REPAIR_STEPS, (('anna nagar', ANNA_NAGAR_STEP),)),
+    (frozenset({'property tax'}), frozenset({'pay', 'how'}), PROPERTY_TAX_STEPS, ()),
+)
+
+class KnowledgeGraph:
+    """
+    Minimal directed graph with node attributes and one relation label per edge.
+    
+    Covers the part of the NetworkX DiGraph API this module uses: nodes keep
+    insertion order, edges are unique per (source, target), and adding an edge
+    creates missing endpoints with no attributes. Node ids are interned, so
+    lookups with the id literals in the keyword tables take the identity fast path.
+    """
+    
+    def __init__(self) -> None:
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self._adj: Dict[str, Dict[str, str]] = {}
+    
+    def add_node(self, node: str, **attrs: Any) -> None:
+        """Add a node, or update the attributes of an existing one."""
+        node = sys.intern(node)
+        self.nodes.setdefault(node, {}).update(attrs)
+        self._adj.setdefault(node, {})
+    
+    def add_edge(self, source: str, target: str, relation: str) -> None:
+        """Add a labelled edge, creating missing endpoints."""
+        self.add_node(source)
+        self.add_node(target)
+        self._adj[source][sys.intern(target)] = relation
+    
+    def successors(self, node: str) -> Iterator[str]:
+        """Iterate over the targets of a node's outgoing edges in insertion order."""
+        return iter(self._adj[node])
+    
+    def number_of_nodes(self) -> int:
+        return len(self.nodes)
+    
+    def number_of_edges(self) -> int:
+        return sum(map(len, self._adj.values()))
 
 class KAGModule:
     """
@@ -24,23 +161,40 @@ class KAGModule:
         Args:
             knowledge_file (str): Path to the knowledge JSON file
         """
+        self.logger = logger
         self.knowledge_file = knowledge_file
         self.knowledge_data = {}
-        self.knowledge_graph = nx.DiGraph()
+        self.knowledge_graph = KnowledgeGraph()
+        
+        # Node and edge counts reported with every response, set once the graph is built
+        self._graph_stats = {'nodes': 0, 'edges': 0}
+        
+        # procedure id -> find_procedure result, for procedures present in the graph
+        self._procedure_resolve: Dict[str, Dict[str, Any]] = {}
+        
+        # issue id -> (issue name, service id, service name, department id, department name)
+        self._issue_resolve: Dict[str, Tuple[str, str, str, str, str]] = {}
+        
+        # Procedure, issue and multi-hop intent keywords, matched against a query in one pass
+        self.keywords = sorted(
+            {keyword for table in (PROCEDURE_KEYWORDS, ISSUE_KEYWORDS) for keyword, _ in table} |
+            {keyword for required, any_of, _, extra_steps in MULTI_HOP_CHAINS
+             for keyword in required | any_of | {keyword for keyword, _ in extra_steps}}
+        )
+        self.keyword_automaton = self._build_keyword_automaton()
+        
+        # Memoized lookups, cleared whenever the knowledge graph is (re)built
+        self._reason_cached = functools.lru_cache(maxsize=2048)(self._reason)
         
         # Load knowledge and build graph
         self.load_knowledge()
         self.build_knowledge_graph()
-        
-        # Setup logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
     
     def load_knowledge(self) -> None:
         """Load structured knowledge from JSON file."""
         try:
             if os.path.exists(self.knowledge_file):
-                with open(self.knowledge_file, 'r') as f:
+                with open(self.knowledge_file, 'r', encoding='utf-8') as f:
                     self.knowledge_data = json.load(f)
                 self.logger.info("Knowledge data loaded successfully")
             else:
@@ -49,7 +203,7 @@ class KAGModule:
             self.logger.error(f"Error loading knowledge: {str(e)}")
     
     def build_knowledge_graph(self) -> None:
-        """Build NetworkX knowledge graph from structured data."""
+        """Build the knowledge graph from structured data."""
         try:
             # Add entity nodes
             entities = self.knowledge_data.get('entities', {})
@@ -99,197 +253,196 @@ class KAGModule:
                     contact=proc_data.get('contact', 'N/A')
                 )
             
-            # Add explicit relationships
-            relationships = self.knowledge_data.get('relationships', [])
-            for rel in relationships:
-                self.knowledge_graph.add_edge(
-                    rel['from'], 
-                    rel['to'], 
-                    relation=rel['type']
-                )
+            # Add explicit relationships, grouped by relation type as {source: target}
+            relationships = self.knowledge_data.get('relationships', {})
+            for relation, edges in relationships.items():
+                for source, target in edges.items():
+                    self.knowledge_graph.add_edge(source, target, relation=relation)
             
-            self.logger.info(f"Built knowledge graph with {self.knowledge_graph.number_of_nodes()} nodes and {self.knowledge_graph.number_of_edges()} edges")
+            self._resolve_procedures()
+            self._resolve_issues()
+            
+            # The graph is not modified after this point; number_of_edges() walks every node
+            self._graph_stats = {
+                'nodes': self.knowledge_graph.number_of_nodes(),
+                'edges': self.knowledge_graph.number_of_edges()
+            }
+            
+            self.logger.info(f"Built knowledge graph with {self._graph_stats['nodes']} nodes and {self._graph_stats['edges']} edges")
             
         except Exception as e:
             self.logger.error(f"Error building knowledge graph: {str(e)}")
+        
+        # Memoized answers were computed from the previous resolution tables
+        self._reason_cached.cache_clear()
+    
+    def _resolve_procedures(self) -> None:
+        """Precompute the find_procedure result for every procedure keyword target."""
+        graph = self.knowledge_graph
+        procedures = self.knowledge_data.get('procedures', {})
+        self._procedure_resolve = {}
+        for _, proc_id in PROCEDURE_KEYWORDS:
+            if proc_id in graph.nodes and proc_id in procedures:
+                node_data = graph.nodes[proc_id]
+                self._procedure_resolve[proc_id] = {
+                    'procedure_id': proc_id,
+                    'title': node_data['name'],
+                    'department': node_data['department'],
+                    'details': procedures[proc_id]
+                }
+    
+    def _resolve_issues(self) -> None:
+        """Precompute the issue -> service -> department walk for every issue node."""
+        graph = self.knowledge_graph
+        self._issue_resolve = {}
+        for issue_id, issue_data in graph.nodes.items():
+            if issue_data.get('type') != 'issue':
+                continue
+            # Find connected service and department
+            try:
+                service_id = next((n for n in graph.successors(issue_id)
+                                   if graph.nodes[n]['type'] == 'service'), None)
+                if service_id is not None:
+                    dept_id = next((n for n in graph.successors(service_id)
+                                    if graph.nodes[n]['type'] == 'department'), None)
+                    if dept_id is not None:
+                        self._issue_resolve[issue_id] = (
+                            issue_data['name'],
+                            service_id,
+                            graph.nodes[service_id]['name'],
+                            dept_id,
+                            graph.nodes[dept_id]['name']
+                        )
+            except Exception as e:
+                self.logger.error(f"Error traversing graph for issue {issue_id}: {str(e)}")
+    
+    def _build_keyword_automaton(self) -> Optional[Any]:
+        """Build a single Aho-Corasick automaton over all procedure, issue and intent keywords."""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword in self.keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
+    def _match_keywords(self, query_lower: str) -> Set[str]:
+        """
+        Find every procedure, issue or intent keyword that occurs in a query.
+        
+        Args:
+            query_lower (str): Lowercased user query
+            
+        Returns:
+            Set of matched keywords
+        """
+        if self.keyword_automaton is not None:
+            return {keyword for _, keyword in self.keyword_automaton.iter(query_lower)}
+        return {keyword for keyword in self.keywords if keyword in query_lower}
     
-    def find_procedure(self, query: str) -> Optional[Dict[str, Any]]:
+    def find_procedure(self, query: str, matched: Optional[Set[str]] = None) -> Optional[Dict[str, Any]]:
         """
         Find relevant procedure based on query keywords.
         
         Args:
             query (str): User query about a procedure
+            matched (Set[str], optional): Keywords already matched in the query
             
         Returns:
             Dict containing procedure information or None
         """
-        query_lower = query.lower()
-        
-        # Procedure keyword mapping
-        procedure_keywords = {
-            'water connection': 'water_connection_new',
-            'new water connection': 'water_connection_new',
-            'apply water': 'water_connection_new',
-            'property tax': 'property_tax_payment',
-            'pay tax': 'property_tax_payment',
-            'tax payment': 'property_tax_payment',
-            'street light': 'street_light_repair',
-            'light repair': 'street_light_repair',
-            'street lamp': 'street_light_repair',
-            'birth certificate': 'birth_certificate',
-            'birth cert': 'birth_certificate'
-        }
-        
-        # Find matching procedure
-        for keyword, proc_id in procedure_keywords.items():
-            if keyword in query_lower:
-                if proc_id in self.knowledge_graph.nodes:
-                    node_data = self.knowledge_graph.nodes[proc_id]
-                    procedures = self.knowledge_data.get('procedures', {})
-                    if proc_id in procedures:
-                        return {
-                            'procedure_id': proc_id,
-                            'title': node_data['name'],
-                            'department': node_data['department'],
-                            'details': procedures[proc_id]
-                        }
+        if matched is None:
+            matched = self._match_keywords(query.lower())
+        
+        # First keyword that resolves to a known procedure wins
+        for keyword, proc_id in PROCEDURE_KEYWORDS:
+            if keyword in matched:
+                resolved = self._procedure_resolve.get(proc_id)
+                if resolved is not None:
+                    return dict(resolved)
         
         return None
     
-    def find_responsible_department(self, issue: str) -> Optional[Dict[str, Any]]:
+    def find_responsible_department(self, issue: str, matched: Optional[Set[str]] = None) -> Optional[Dict[str, Any]]:
         """
         Find which department handles a specific civic issue.
         
         Args:
             issue (str): Description of the civic issue
+            matched (Set[str], optional): Keywords already matched in the query
             
         Returns:
             Dict with department information or None
         """
-        issue_lower = issue.lower()
-        
-        # Issue to department mapping based on knowledge graph
-        issue_keywords = {
-            'water': ['no_water', 'water_contamination', 'pipeline_leak'],
-            'sewage': ['sewage_overflow', 'blocked_drain'],
-            'garbage': ['garbage_not_collected'],
-            'waste': ['garbage_not_collected'],
-            'street light': ['street_light_not_working'],
-            'road': ['pothole'],
-            'electricity': ['power_cut'],
-            'power': ['power_cut']
-        }
+        if matched is None:
+            matched = self._match_keywords(issue.lower())
         
         # Find matching issue node
-        for keyword, issue_ids in issue_keywords.items():
-            if keyword in issue_lower:
+        for keyword, issue_ids in ISSUE_KEYWORDS:
+            if keyword in matched:
                 for issue_id in issue_ids:
-                    if issue_id in self.knowledge_graph.nodes:
-                        # Find connected service and department
-                        try:
-                            service_nodes = [n for n in self.knowledge_graph.successors(issue_id) 
-                                           if self.knowledge_graph.nodes[n]['type'] == 'service']
-                            if service_nodes:
-                                service_id = service_nodes[0]
-                                dept_nodes = [n for n in self.knowledge_graph.successors(service_id)
-                                            if self.knowledge_graph.nodes[n]['type'] == 'department']
-                                if dept_nodes:
-                                    dept_id = dept_nodes[0]
-                                    dept_data = self.knowledge_graph.nodes[dept_id]
-                                    return {
-                                        'issue_id': issue_id,
-                                        'issue_name': self.knowledge_graph.nodes[issue_id]['name'],
-                                        'service_id': service_id,
-                                        'service_name': self.knowledge_graph.nodes[service_id]['name'],
-                                        'department_id': dept_id,
-                                        'department_name': dept_data['name']
-                                    }
-                        except Exception as e:
-                            self.logger.error(f"Error traversing graph for issue {issue_id}: {str(e)}")
-                            continue
+                    resolved = self._issue_resolve.get(issue_id)
+                    if resolved is not None:
+                        issue_name, service_id, service_name, dept_id, dept_name = resolved
+                        return {
+                            'issue_id': issue_id,
+                            'issue_name': issue_name,
+                            'service_id': service_id,
+                            'service_name': service_name,
+                            'department_id': dept_id,
+                            'department_name': dept_name
+                        }
         
         return None
     
-    def multi_hop_reasoning(self, query: str) -> List[Dict[str, Any]]:
+    def multi_hop_reasoning(self, query: str, query_lower: Optional[str] = None,
+                            matched: Optional[Set[str]] = None) -> Tuple[Dict[str, Any], ...]:
         """
         Perform multi-hop reasoning across the knowledge graph.
         
         Args:
             query (str): Complex query requiring multi-hop reasoning
+            query_lower (str, optional): Precomputed lowercase form of the query
+            matched (Set[str], optional): Keywords already matched in the query
             
         Returns:
-            List of reasoning steps with intermediate results
+            Read-only tuple of shared reasoning steps with intermediate results
         """
-        reasoning_steps = []
-        query_lower = query.lower()
-        
-        # Example multi-hop query: "How to get water pipeline repaired in Anna Nagar?"
-        if 'repair' in query_lower and ('water' in query_lower or 'pipeline' in query_lower):
-            # Step 1: Identify the issue
-            reasoning_steps.append({
-                'step': 1,
-                'action': 'Identify Issue',
-                'result': 'Water pipeline repair needed',
-                'node': 'pipeline_leak'
-            })
-            
-            # Step 2: Find responsible service
-            reasoning_steps.append({
-                'step': 2,
-                'action': 'Find Responsible Service',
-                'result': 'Water Supply Service',
-                'node': 'water_supply'
-            })
-            
-            # Step 3: Find responsible department
-            reasoning_steps.append({
-                'step': 3,
-                'action': 'Find Responsible Department',
-                'result': 'Chennai Metro Water Supply and Sewerage Board (CMWSSB)',
-                'node': 'cmwssb'
-            })
-            
-            # Step 4: Get contact and procedure
-            reasoning_steps.append({
-                'step': 4,
-                'action': 'Get Contact Information',
-                'result': 'Call CMWSSB complaint cell: 044-45674567',
-                'details': 'Available 24x7 for emergency repairs'
-            })
-            
-            # Step 5: Add area-specific information if mentioned
-            if 'anna nagar' in query_lower:
-                reasoning_steps.append({
-                    'step': 5,
-                    'action': 'Area-specific Contact',
-                    'result': 'Anna Nagar falls under North Zone',
-                    'details': 'Zone contact: 044-28451300 Ext.233'
-                })
-        
-        # Multi-hop for property tax queries
-        elif 'property tax' in query_lower and ('pay' in query_lower or 'how' in query_lower):
-            reasoning_steps.append({
-                'step': 1,
-                'action': 'Identify Service',
-                'result': 'Property Tax Payment',
-                'node': 'property_tax'
-            })
-            
-            reasoning_steps.append({
-                'step': 2,
-                'action': 'Find Department',
-                'result': 'Greater Chennai Corporation (GCC)',
-                'node': 'gcc'
-            })
+        if matched is None:
+            matched = self._match_keywords(query_lower if query_lower is not None else query.lower())
+        
+        # First chain whose intent keywords all occur in the query wins
+        for required, any_of, steps, extra_steps in MULTI_HOP_CHAINS:
+            if required <= matched and not any_of.isdisjoint(matched):
+                extra = tuple(step for keyword, step in extra_steps if keyword in matched)
+                return steps + extra if extra else steps
+        
+        return ()
+    
+    def _reason(self, query_lower: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], Tuple[Dict[str, Any], ...]]:
+        """
+        Run all knowledge graph lookups for a normalized query (memoized per instance).
+        
+        Args:
+            query_lower (str): Lowercased query with whitespace collapsed
             
-            reasoning_steps.append({
-                'step': 3,
-                'action': 'Get Procedure',
-                'result': 'Online payment procedure available',
-                'node': 'property_tax_payment'
-            })
-        
-        return reasoning_steps
+        Returns:
+            Tuple of (procedure, department info, reasoning steps)
+        """
+        # Scan for keywords once for all lookups
+        matched = self._match_keywords(query_lower)
+        
+        # Check if query asks for procedure
+        procedure = self.find_procedure(query_lower, matched)
+        
+        # Check if query asks about issue handling
+        department_info = self.find_responsible_department(query_lower, matched)
+        
+        # Perform multi-hop reasoning
+        reasoning_steps = self.multi_hop_reasoning(query_lower, query_lower=query_lower, matched=matched)
+        
+        return procedure, department_info, reasoning_steps
     
     def get_response(self, query: str) -> Dict[str, Any]:
         """
@@ -302,30 +455,22 @@ class KAGModule:
             Dict containing response data and reasoning steps
         """
         try:
-            # Check if query asks for procedure
-            procedure = self.find_procedure(query)
-            
-            # Check if query asks about issue handling
-            department_info = self.find_responsible_department(query)
-            
-            # Perform multi-hop reasoning
-            reasoning_steps = self.multi_hop_reasoning(query)
+            # The graph is static, so reasoning depends only on the normalized query
+            procedure, department_info, reasoning_steps = self._reason_cached(" ".join(query.lower().split()))
             
             if procedure or department_info or reasoning_steps:
                 return {
                     'success': True,
                     'data': {
-                        'procedure': procedure,
-                        'department_info': department_info,
+                        # Copies, so callers cannot alter later cache hits
+                        'procedure': dict(procedure) if procedure else procedure,
+                        'department_info': dict(department_info) if department_info else department_info,
                         'reasoning_steps': reasoning_steps,
-                        'graph_stats': {
-                            'nodes': self.knowledge_graph.number_of_nodes(),
-                            'edges': self.knowledge_graph.number_of_edges()
-                        }
+                        'graph_stats': dict(self._graph_stats)
                     },
                     'source': 'KAG',
                     'query': query,
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': time.time_ns(),
                     'message': f'Knowledge graph reasoning completed with {len(reasoning_steps)} steps'
                 }
             else:
@@ -346,6 +491,22 @@ class KAGModule:
                 'error': str(e)
             }
     
+    def get_responses(self, queries: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get KAG responses for a batch of queries, e.g. for offline evaluation runs.
+        
+        Repeated queries in the batch (up to case and spacing) are answered from
+        the reasoning cache.
+        
+        Args:
+            queries (List[str]): User queries
+            
+        Returns:
+            List of response dicts, in the same order as the queries
+        """
+        get_response = self.get_response
+        return [get_response(query) for query in queries]
+    
     def format_response(self, response_data: Dict[str, Any]) -> str:
         """
         Format the KAG response into user-friendly text.
@@ -360,49 +521,50 @@ class KAGModule:
             return f"I don't have structured knowledge about '{response_data.get('query', 'your request')}'. Let me try other sources."
         
         data = response_data['data']
-        formatted_text = "🧠 **Knowledge Graph Analysis:**\\n\\n"
+        
+        # Collect fragments and join once at the end
+        parts = ["🧠 **Knowledge Graph Analysis:**\\n\\n"]
+        append = parts.append
         
         # Format reasoning steps
         if data['reasoning_steps']:
-            formatted_text += "🔗 **Step-by-step Reasoning:**\\n"
+            append("🔗 **Step-by-step Reasoning:**\\n")
             for step in data['reasoning_steps']:
-                formatted_text += f"{step['step']}. **{step['action']}:** {step['result']}\\n"
+                append(f"{step['step']}. **{step['action']}:** {step['result']}\\n")
                 if 'details' in step:
-                    formatted_text += f"   *{step['details']}*\\n"
-            formatted_text += "\\n"
+                    append(f"   *{step['details']}*\\n")
+            append("\\n")
         
         # Format procedure information
         if data['procedure']:
             proc = data['procedure']
-            formatted_text += f"📋 **Procedure: {proc['title']}**\\n"
-            formatted_text += f"🏛️ **Department:** {proc['department'].upper()}\\n\\n"
+            append(f"📋 **Procedure: {proc['title']}**\\n")
+            append(f"🏛️ **Department:** {proc['department'].upper()}\\n\\n")
             
             details = proc['details']
-            formatted_text += "📝 **Steps to Follow:**\\n"
-            for i, step in enumerate(details['steps'], 1):
-                formatted_text += f"{i}. {step}\\n"
+            append("📝 **Steps to Follow:**\\n")
+            parts.extend(f"{i}. {step}\\n" for i, step in enumerate(details['steps'], 1))
             
-            formatted_text += f"\\n⏱️ **Timeline:** {details['timeline']}\\n"
-            formatted_text += f"💰 **Fees:** {details.get('fees', 'N/A')}\\n"
-            formatted_text += f"📞 **Contact:** {details['contact']}\\n\\n"
+            append(f"\\n⏱️ **Timeline:** {details['timeline']}\\n")
+            append(f"💰 **Fees:** {details.get('fees', 'N/A')}\\n")
+            append(f"📞 **Contact:** {details['contact']}\\n\\n")
             
             if 'documents' in details:
-                formatted_text += "📄 **Required Documents:**\\n"
-                for doc in details['documents']:
-                    formatted_text += f"• {doc}\\n"
-                formatted_text += "\\n"
+                append("📄 **Required Documents:**\\n")
+                parts.extend(f"• {doc}\\n" for doc in details['documents'])
+                append("\\n")
         
         # Format department information
         if data['department_info']:
             dept = data['department_info']
-            formatted_text += f"🏛️ **Responsible Department:**\\n"
-            formatted_text += f"• **Issue:** {dept['issue_name']}\\n"
-            formatted_text += f"• **Service:** {dept['service_name']}\\n"
-            formatted_text += f"• **Department:** {dept['department_name']}\\n\\n"
+            append(f"🏛️ **Responsible Department:**\\n")
+            append(f"• **Issue:** {dept['issue_name']}\\n")
+            append(f"• **Service:** {dept['service_name']}\\n")
+            append(f"• **Department:** {dept['department_name']}\\n\\n")
         
-        formatted_text += f"📊 *Processed via Knowledge Graph ({data['graph_stats']['nodes']} entities, {data['graph_stats']['edges']} relationships)*"
+        append(f"📊 *Processed via Knowledge Graph ({data['graph_stats']['nodes']} entities, {data['graph_stats']['edges']} relationships)*")
         
-        return formatted_text
+        return "".join(parts)
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -432,7 +594,7 @@ with open('CivicMindAI/kag_module.py', 'w') as f:
 
 print("✅ KAG (Knowledge-Augmented Generation) module created!")
 print("Features implemented:")
-print("  • NetworkX knowledge graph construction")
+print("  • Lightweight directed knowledge graph construction")
 print("  • Entity relationship mapping")
 print("  • Multi-hop reasoning chains")
 print("  • Procedure step-by-step guidance")